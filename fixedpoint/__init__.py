@@ -40,6 +40,11 @@ __version__ = "1.0.1"
 
 from fixedpoint.fixedpoint import *  # noqa # ignore unused imports
 from fixedpoint.functions import *  # noqa # ignore unused imports
+from fixedpoint import json  # noqa # ignore unused imports
+try:
+    from fixedpoint.array import *  # noqa # ignore unused imports
+except ImportError:  # pragma: no cover # numpy is an optional dependency
+    pass
 
 
 class FixedPointError(Exception):
@@ -0,0 +1,382 @@
+"""FixedPointArray class.
+
+Requires numpy.
+"""
+from typing import (Any, Callable, cast, Dict, Iterable, Iterator, List,
+                    Tuple, Type, TypeVar, Union, overload)
+
+import numpy as np
+
+from fixedpoint.fixedpoint import (FixedPoint, _add_bits, _sub_bits,
+                                   _mul_bits, _signedint)
+from fixedpoint.properties import PROPERTIES, StrConv, ResolvedProps
+
+__all__ = ('FixedPointArray',)
+
+FixedPointArrayType = TypeVar("FixedPointArrayType", bound="FixedPointArray")
+Operand = Union["FixedPointArray", FixedPoint, int, float]
+
+# Words wider than this are stored as Python ints (an object array) so that
+# intermediate arithmetic results cannot overflow numpy.int64.
+_MAXINT64BITS = 62
+
+
+def _dtype(nbits: int) -> Any:
+    """The numpy dtype used to store `nbits`-wide words."""
+    return np.int64 if nbits <= _MAXINT64BITS else object
+
+
+def _int64_values(bits: np.ndarray, signed: bool, m: int, n: int,
+                  nfrac: int) -> np.ndarray:
+    """Signed values of int64 words, aligned to `nfrac` fractional bits.
+
+    Shifting the word to the top of the int64 and arithmetically shifting it
+    back sign extends and aligns the binary point in two passes.
+    """
+    if signed:
+        top = 64 - m - n
+        return cast(np.ndarray, (bits.view(np.uint64) << np.uint64(top))
+                    .view(np.int64) >> (top - nfrac + n))
+    return cast(np.ndarray, bits << (nfrac - n))
+
+
+# Fused int64 kernels for each bit arithmetic helper: the elementwise
+# operation, whether binary points are aligned first, and whether the result
+# is masked (unsigned subtraction overflow is handled by the caller).
+_INT64_KERNELS: Dict[Callable[..., Any], Tuple[np.ufunc, bool, bool]] = {
+    _add_bits: (np.add, True, True),
+    _sub_bits: (np.subtract, True, False),
+    _mul_bits: (np.multiply, False, True),
+}
+
+
+class FixedPointArray:
+    """Array of fixed point numbers sharing one Q format and property set."""
+
+    __slots__ = ('_bits', '_proto')
+    # Opt out of numpy ufuncs, so numpy operands use the reflected operators
+    __array_ufunc__ = None
+    _bits: np.ndarray  # Raw bits of each fixed point number
+    _proto: FixedPoint  # Holds the Q format and properties of every element
+
+    def __init__(self: FixedPointArrayType, init: Iterable[Any], /,
+                 signed: bool = None, m: int = None, n: int = None,
+                 **props: Union[str, int]) -> None:
+        """Initialize from an iterable of FixedPoint objects or values.
+
+        FixedPoint objects must share a Q format; their properties are
+        resolved the same way arithmetic operators resolve them. Any other
+        value (int, float, or str) is converted with the FixedPoint
+        constructor, and elements are then widened to a common Q format.
+        """
+        elements = list(init)
+        if not elements:
+            raise ValueError("Cannot initialize an empty FixedPointArray.")
+
+        fps: List[FixedPoint]
+        if all(isinstance(x, FixedPoint) for x in elements):
+            fps = elements
+            if len({(x._signed, x._m, x._n) for x in fps}) != 1:
+                raise ValueError("FixedPoint elements must share a Q format.")
+            if signed is not None or m is not None or n is not None or props:
+                raise ValueError("Q format and properties are taken from "
+                                 "FixedPoint elements.")
+            resolved = FixedPoint._RESOLVE.all(*fps)
+        else:
+            fps = [FixedPoint(x, signed, m, n, **props)  # type: ignore
+                   for x in elements]
+            # Widen to a Q format that every element fits in
+            s = any(x._signed for x in fps)
+            qm = max(x._m for x in fps) + (s and not all(x._signed
+                                                         for x in fps))
+            qn = max(x._n for x in fps)
+            if any((x._signed, x._m, x._n) != (s, qm, qn) for x in fps):
+                fps = [FixedPoint(x, s, qm, qn, **props)  # type: ignore
+                       for x in elements]
+            resolved = {p: getattr(fps[0], p) for p in PROPERTIES}
+
+        first = fps[0]
+        dtype = _dtype(first._m + first._n)
+        self._bits = np.array([x._bits for x in fps], dtype=dtype)
+        self._proto = self.__prototype(first._signed, first._m, first._n,
+                                       resolved)
+
+    @classmethod
+    def from_bits(cls: Type[FixedPointArrayType], bits: Iterable[int],
+                  signed: bool, m: int, n: int, /, *, overflow: str = 'clamp',
+                  rounding: str = 'auto', str_base: int = 16,
+                  overflow_alert: str = 'error',
+                  implicit_cast_alert: str = 'warning',
+                  mismatch_alert: str = 'warning') -> FixedPointArrayType:
+        """Initialize from raw bits in the given Q format.
+
+        No rounding or overflow handling occurs; excess bits are masked off.
+        """
+        # Validates the Q format and properties
+        proto = FixedPoint(0, signed, m, n, overflow=overflow,
+                           rounding=rounding, str_base=str_base,
+                           overflow_alert=overflow_alert,
+                           implicit_cast_alert=implicit_cast_alert,
+                           mismatch_alert=mismatch_alert)
+        nbits = proto._m + proto._n
+        return cls.__new(np.array(bits, dtype=_dtype(nbits)) &
+                         ((1 << nbits) - 1), proto)
+
+    @classmethod
+    def __new(cls: Type[FixedPointArrayType], bits: np.ndarray,
+              proto: FixedPoint) -> FixedPointArrayType:
+        """Quick initialization for internal computations."""
+        self: FixedPointArrayType = super().__new__(cls)
+        self._bits = bits
+        self._proto = proto
+        return self
+
+    ###########################################################################
+    # Properties
+    ###########################################################################
+    @property
+    def signed(self: FixedPointArrayType) -> bool:
+        """Signedness."""
+        return self._proto.signed
+
+    @property
+    def m(self: FixedPointArrayType) -> int:
+        """Integer bit width."""
+        return self._proto.m
+
+    @property
+    def n(self: FixedPointArrayType) -> int:
+        """Fractional bit width."""
+        return self._proto.n
+
+    @property
+    def qformat(self: FixedPointArrayType) -> str:
+        """Q format indicating signedness, and integer/fractional bit width."""
+        return self._proto.qformat
+
+    @property
+    def bits(self: FixedPointArrayType) -> np.ndarray:
+        """Copy of the raw bits of each element."""
+        return cast(np.ndarray, self._bits.copy())
+
+    @property
+    def properties(self: FixedPointArrayType) -> ResolvedProps:
+        """Property settings shared by all elements."""
+        return {p: getattr(self._proto, p) for p in PROPERTIES}
+
+    ###########################################################################
+    # Element access
+    ###########################################################################
+    def __len__(self: FixedPointArrayType) -> int:
+        """Number of elements."""
+        return len(self._bits)
+
+    @overload
+    def __getitem__(self: FixedPointArrayType, key: int) -> FixedPoint:
+        ...  # pragma: no cover
+
+    @overload
+    def __getitem__(self: FixedPointArrayType,
+                    key: slice) -> FixedPointArrayType:
+        ...  # pragma: no cover
+
+    def __getitem__(self: FixedPointArrayType, key: Union[int, slice]) -> \
+            Union[FixedPoint, FixedPointArrayType]:
+        """Retrieve an element as a FixedPoint, or a slice as an array."""
+        if isinstance(key, slice):
+            return self.__class__.__new(self._bits[key], self._proto)
+        ret = FixedPoint(self._proto)
+        ret._bits = int(self._bits[key])
+        return ret
+
+    def __iter__(self: FixedPointArrayType) -> Iterator[FixedPoint]:
+        """Iterate over elements as FixedPoint objects."""
+        for i in range(len(self._bits)):
+            yield self[i]
+
+    def to_float(self: FixedPointArrayType) -> np.ndarray:
+        """Floating point representation of each element."""
+        proto = self._proto
+        value = _signedint(self._bits, proto._signed, proto._m + proto._n)
+        return cast(np.ndarray,
+                    np.ldexp(value.astype(np.float64), -proto._n))
+
+    def __repr__(self: FixedPointArrayType) -> str:
+        """Python-executable code string, allows for exact reproduction."""
+        proto = self._proto
+        return (f"FixedPointArray("
+                f"{[StrConv[16](int(x)) for x in self._bits]!r}, "
+                f"signed={int(proto._signed)}, "
+                f"m={proto._m}, "
+                f"n={proto._n}, "
+                f"overflow={proto.overflow!r}, "
+                f"rounding={proto.rounding!r}, "
+                f"overflow_alert={proto.overflow_alert!r}, "
+                f"mismatch_alert={proto.mismatch_alert!r}, "
+                f"implicit_cast_alert={proto.implicit_cast_alert!r}, "
+                f"str_base={proto.str_base})")
+
+    ###########################################################################
+    # Operators
+    ###########################################################################
+    def __operand(self: FixedPointArrayType, other: Operand,
+                  signed: bool = None) -> Tuple[Any, FixedPoint,
+                                                ResolvedProps]:
+        """Bits and prototype of other, and the resolved properties."""
+        proto = self._proto
+        if isinstance(other, FixedPointArray):
+            if len(other) != len(self):
+                raise ValueError(f"Length mismatch: {len(self)} and "
+                                 f"{len(other)}.")
+            return other._bits, other._proto, \
+                FixedPoint._RESOLVE.all(proto, other._proto)
+        if isinstance(other, FixedPoint):
+            return other._bits, other, FixedPoint._RESOLVE.all(proto, other)
+        if isinstance(other, np.generic):
+            other = other.item()
+        if not isinstance(other, (int, float)):
+            raise TypeError(f"Unsupported type {type(other)}.")
+
+        # Implicit cast, same as FixedPoint operators do
+        fother = FixedPoint(other, signed)
+        if isinstance(other, float) and (error := abs(other - float(fother))):
+            proto._iwarn("Casting %r to %s introduces an error of %e",
+                         other, fother.qformat, error, stacklevel=4)
+        return fother._bits, fother, FixedPoint._RESOLVE.all(proto)
+
+    def __arithmetic(self: FixedPointArrayType, other: Operand,
+                     compute: Callable[..., Tuple[Any, bool, int, int]],
+                     reflected: bool = False, signed: bool = None) -> \
+            Tuple[Any, bool, int, int, ResolvedProps]:
+        """Perform arithmetic on bits widened to fit the result."""
+        obits, oproto, props = self.__operand(other, signed)
+        a = (self._bits, self._proto._signed, self._proto._m, self._proto._n)
+        b = (obits, oproto._signed, oproto._m, oproto._n)
+        if reflected:
+            a, b = b, a
+
+        # Determine the result width first, so the operands can be widened
+        _, rsigned, m, n = compute(0, *a[1:], 0, *b[1:])
+        dtype = _dtype(m + n)
+        a = (np.asarray(a[0], dtype=dtype), *a[1:])
+        b = (np.asarray(b[0], dtype=dtype), *b[1:])
+        if dtype is object:
+            return (*compute(*a, *b), props)
+
+        ufunc, align, masked = _INT64_KERNELS[compute]
+        bits = ufunc(_int64_values(*a, n if align else a[3]),
+                     _int64_values(*b, n if align else b[3]))
+        if masked:
+            bits &= (1 << (m + n)) - 1
+        return bits, rsigned, m, n, props
+
+    def __add__(self: FixedPointArrayType,
+                other: Operand) -> FixedPointArrayType:
+        """Full precision elementwise addition operator."""
+        bits, signed, m, n, props = self.__arithmetic(other, _add_bits)
+        return self.__class__.__new(bits, self.__prototype(signed, m, n,
+                                                           props))
+
+    __radd__ = __add__
+
+    def __subtract(self: FixedPointArrayType, other: Operand,
+                   reflected: bool) -> FixedPointArrayType:
+        """Full precision elementwise subtraction."""
+        # Like FixedPoint, numbers are cast using the array's signedness
+        bits, signed, m, n, props = self.__arithmetic(other, _sub_bits,
+                                                      reflected,
+                                                      self._proto._signed)
+        proto = self.__prototype(signed, m, n, props)
+
+        # Check overflow condition
+        if not signed and (negative := bits < 0).any():
+            proto._owarn("Unsigned subtraction causes overflow.")
+            if clamp := (proto.overflow == 'clamp'):
+                bits = np.where(negative, 0, bits).astype(bits.dtype)
+            proto._owarn("%s minimum.", "Clamped to" if clamp else "Wrapped")
+
+        return self.__class__.__new(bits & ((1 << (m + n)) - 1), proto)
+
+    def __sub__(self: FixedPointArrayType,
+                other: Operand) -> FixedPointArrayType:
+        """Full precision elementwise subtraction operator."""
+        return self.__subtract(other, False)
+
+    def __rsub__(self: FixedPointArrayType,
+                 other: Operand) -> FixedPointArrayType:
+        """Full precision elementwise reflected subtraction."""
+        return self.__subtract(other, True)
+
+    def __mul__(self: FixedPointArrayType,
+                other: Operand) -> FixedPointArrayType:
+        """Full precision elementwise multiplication operator."""
+        bits, signed, m, n, props = self.__arithmetic(other, _mul_bits)
+        return self.__class__.__new(bits, self.__prototype(signed, m, n,
+                                                           props))
+
+    __rmul__ = __mul__
+
+    def __round__(self: FixedPointArrayType,
+                  nfrac: int, /) -> FixedPointArrayType:
+        """Elementwise fractional rounding. This is the "round()" function.
+
+        Every element is rounded at once with the rounding scheme specified
+        by the rounding property, and an overflow alert is issued once for
+        the array.
+        """
+        proto = self._proto
+        proto._rounding_arg_check(nfrac)
+        signed, m, n, rounding = proto._signed, proto._m, proto._n, \
+            proto.rounding
+
+        ntrunc = n - nfrac
+        bits = self._bits
+        truncated = bits & ((1 << ntrunc) - 1)
+        tie = 1 << (ntrunc - 1)
+        bits = bits >> ntrunc
+
+        if signed:
+            negative = (self._bits >> (m + n - 1)) != 0
+        else:
+            negative = np.zeros(len(bits), dtype=bool)
+
+        # Decide which elements round away from the truncated bits
+        if rounding == 'down':
+            must_round = np.zeros(len(bits), dtype=bool)
+        elif rounding == 'in':
+            must_round = negative & (truncated != 0)
+        elif rounding == 'up':
+            must_round = truncated != 0
+        elif rounding == 'nearest':
+            must_round = truncated >= tie
+        elif rounding == 'out':
+            must_round = np.where(truncated == tie, ~negative, truncated > tie)
+        else:
+            must_round = ((truncated & tie) != 0) & \
+                (((truncated & (tie - 1)) != 0) | ((bits & 1) != 0))
+
+        # Rounding in can't overflow; other schemes can at the maximum
+        maximum = (1 << (m - signed + nfrac)) - 1
+        if rounding != 'in' and (overflow := must_round &
+                                 (bits == maximum)).any():
+            verb = {'convergent': 'Convergent round', 'out': 'Rounding out',
+                    'nearest': 'Rounding to nearest',
+                    'up': 'Rounding up'}[rounding]
+            proto._owarn(f"{verb} to %s.%d causes overflow.",
+                         proto.qformat.split('.')[0], nfrac)
+            clamp = proto.overflow == 'clamp'
+            proto._owarn("%s maximum.", 'Clamped to' if clamp else "Wrapped")
+            if clamp:
+                must_round &= ~overflow
+
+        bits = (bits + must_round.astype(bits.dtype)) & \
+            ((1 << (m + nfrac)) - 1)
+        return self.__class__.__new(
+            np.asarray(bits, dtype=_dtype(m + nfrac)),
+            self.__prototype(signed, m, nfrac, self.properties))
+
+    @staticmethod
+    def __prototype(signed: bool, m: int, n: int,
+                    props: ResolvedProps) -> FixedPoint:
+        """Generate the FixedPoint holding an array's format and properties."""
+        return FixedPoint._new(0, signed, m, n, **props)  # type: ignore
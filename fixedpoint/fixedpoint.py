@@ -1,15 +1,16 @@
 """FixedPoint class."""
 import logging
-from math import log2 as _log2, ceil as _ceil
+from functools import lru_cache
+from math import ceil as _ceil
 import sys
 import operator
 from typing import (Any, Callable, cast, ClassVar, Dict, List, Literal,
-                    Mapping, overload, Tuple, Type, TypeVar, Union)
+                    Mapping, Optional, overload, Tuple, Type, TypeVar, Union)
 
 from fixedpoint.properties import (StrBase, StrConv, Alert, Overflow, Rounding,
-                                   ResolvedProps, PropertyResolver)
+                                   ResolvedProps, PropertyResolver,
+                                   _property_members)
 from fixedpoint.logging import WARNER, LOGGER
-from fixedpoint.json import DEFAULT_ENCODER, DEFAULT_DECODER
 
 __all__ = ('FixedPoint',)
 
@@ -18,6 +19,15 @@ Numeric = Union[FixedPointType, int, float]
 Integral = Union[FixedPointType, int, bool]
 AttrReturn = Tuple[int, bool, int, int]
 _MAXEXPONENT = max(abs(sys.float_info.max_exp), abs(sys.float_info.min_exp))
+# Enum members checked on every alert and overflow
+_ERROR = Alert['error']
+_CLAMP = Overflow['clamp']
+# Number of bits represented by each digit of a power-of-2 str_base
+_DIGIT_BITS = {2: 1, 8: 3, 16: 4}
+# Filled in with the bits, Q format, and property settings by __repr__
+_REPR_TEMPLATE = ("FixedPoint(%r, signed=%d, m=%d, n=%d, overflow=%r, "
+                  "rounding=%r, overflow_alert=%r, mismatch_alert=%r, "
+                  "implicit_cast_alert=%r, str_base=%d)")
 
 
 def _sn(__id: Mapping[str, object]) -> int:
@@ -28,6 +38,103 @@ def _sn(__id: Mapping[str, object]) -> int:
     return cast(Mapping[str, int], __id['extra'])['sn']
 
 
+@lru_cache(maxsize=1024)
+def _qformat(signed: bool, m: int, n: int) -> str:
+    """Q format string, memoized since it is built for every alert and log."""
+    return f"{'' if signed else 'U'}Q{m}.{n}"
+
+
+@lru_cache(maxsize=1024)
+def _bitmask(nbits: int) -> int:
+    """Mask of `nbits` ones, memoized since wide masks are costly to build."""
+    return (1 << nbits) - 1
+
+
+@lru_cache(maxsize=128)
+def _parse_format_spec(spec: str) -> Tuple[str, str]:
+    """What a FixedPoint format spec formats, and the spec to format it with.
+
+    Memoized since the same spec is usually used to format many values.
+    """
+    # All bits
+    if spec == '' or spec[-1] in 'bdoxX':
+        return 'bits', spec
+
+    # Integer or fractional bits
+    if spec[-1] in 'mn':
+        return spec[-1], spec[:-1]
+
+    # str() or float()
+    if spec[-1] in 's':
+        return 's', spec
+    if spec[-1] in 'eEfFgG%':
+        return 'float', spec
+
+    # qformat
+    if spec[-1] == 'q':
+        return 'q', f"{spec[:-1]}s"
+
+    raise ValueError(f"Unknown format code {spec!r}.")
+
+
+###############################################################################
+# Bit arithmetic
+#
+# These operate on raw bits and Q formats only, so they work the same whether
+# the bits are an int or a numpy.ndarray of ints.
+###############################################################################
+def _signedint(bits: Any, signed: bool, nbits: int) -> Any:
+    """Signed value of `nbits`-wide bits.
+
+    The bits must already fit in `nbits`, which holds for any FixedPoint.
+    """
+    return bits - ((bits >> (nbits - 1)) << nbits) if signed else bits
+
+
+# The helpers below inline _signedint and avoid max(); they run for nearly
+# every arithmetic operation, so function call overhead dominates otherwise.
+def _add_bits(abits: Any, asigned: bool, am: int, an: int, bbits: Any,
+              bsigned: bool, bm: int, bn: int) -> Tuple[Any, bool, int, int]:
+    """Sum of two fixed point words, along with its Q format."""
+    n = an if an > bn else bn
+    m = (am if am > bm else bm) + 1
+    if asigned:
+        abits = abits - ((abits >> (am + an - 1)) << (am + an))
+    if bsigned:
+        bbits = bbits - ((bbits >> (bm + bn - 1)) << (bm + bn))
+    bits = (abits << (n - an)) + (bbits << (n - bn))
+    return bits & ((1 << (m + n)) - 1), bool(asigned or bsigned), m, n
+
+
+def _sub_bits(abits: Any, asigned: bool, am: int, an: int, bbits: Any,
+              bsigned: bool, bm: int, bn: int) -> Tuple[Any, bool, int, int]:
+    """Difference of two fixed point words, along with its Q format.
+
+    The bits are not masked, so unsigned overflow (a negative difference) can
+    be detected and handled by the caller.
+    """
+    n = an if an > bn else bn
+    m = 1 + (am if am > bm else bm) + (bool(asigned) ^ bool(bsigned))
+    if asigned:
+        abits = abits - ((abits >> (am + an - 1)) << (am + an))
+    if bsigned:
+        bbits = bbits - ((bbits >> (bm + bn - 1)) << (bm + bn))
+    bits = (abits << (n - an)) - (bbits << (n - bn))
+    return bits, bool(asigned or bsigned), m, n
+
+
+def _mul_bits(abits: Any, asigned: bool, am: int, an: int, bbits: Any,
+              bsigned: bool, bm: int, bn: int) -> Tuple[Any, bool, int, int]:
+    """Product of two fixed point words, along with its Q format."""
+    m, n = am + bm, an + bn
+    if asigned:
+        abits = abits - ((abits >> (am + an - 1)) << (am + an))
+    if bsigned:
+        bbits = bbits - ((bbits >> (bm + bn - 1)) << (bm + bn))
+    return (abits * bbits) & ((1 << (m + n)) - 1), \
+        bool(asigned or bsigned), m, n
+
+
 class FixedPointBits(int):
     """Allow for slicing and mapping into FixedPoint.bits."""
 
@@ -137,6 +244,9 @@ class FixedPoint:
     __slots__ = ('_bits', '_signed', '_m', '_n', '_str_base', '_overflow',
                  '_rounding', '_overflow_alert', '_implicit_cast_alert',
                  '_mismatch_alert', '__id', '__cmstack', '__context')
+    # Attributes copied from another FixedPoint object or saved by a context
+    _COPYSLOTS: ClassVar[Tuple[str, ...]] = tuple(x for x in __slots__
+                                                  if '__' not in x)
     _RESOLVE: ClassVar[PropertyResolver]  # Resolves properties for new objects
     _SERIAL_NUMBER: ClassVar[int]  # Logging aid
     _bits: int  # Raw bits of the fixed point number
@@ -194,10 +304,38 @@ class FixedPoint:
         self.__id = {'stacklevel': 2, 'extra': {'sn': cls._SERIAL_NUMBER}}
         return self
 
+    # Used by FixedPointArray
+    _new = __new
+
+    def __new_like(self: FixedPointType, bits: int, signed: bool, m: int,
+                   n: int) -> FixedPointType:
+        """Quick initialization with the same properties as self."""
+        cls = self.__class__
+        ret: FixedPointType = super().__new__(cls)
+        cls._SERIAL_NUMBER += 1
+        ret._bits = bits
+        ret._signed = signed
+        ret._m = m
+        ret._n = n
+        ret._overflow = self._overflow
+        ret._rounding = self._rounding
+        ret._str_base = self._str_base
+        ret._overflow_alert = self._overflow_alert
+        ret._mismatch_alert = self._mismatch_alert
+        ret._implicit_cast_alert = self._implicit_cast_alert
+        ret.__cmstack = []
+        ret.__context = {}
+        ret.__id = {'stacklevel': 2, 'extra': {'sn': cls._SERIAL_NUMBER}}
+        return ret
+
     def __getnewargs__(self: FixedPointType) -> Tuple[str]:
         """Support pickling with positional-only arguments."""
         return (hex(self._bits),)
 
+    def __copy__(self: FixedPointType) -> FixedPointType:
+        """Copy without validating the Q format and properties again."""
+        return self.__new_like(self._bits, self._signed, self._m, self._n)
+
     ###########################################################################
     # Initialization methods
     ###########################################################################
@@ -241,7 +379,7 @@ class FixedPoint:
 
         # Copy attributes into a new object
         if isinstance(init, FixedPoint):
-            for attr in [x for x in init.__slots__ if '__' not in x]:
+            for attr in self._COPYSLOTS:
                 setattr(self, attr, getattr(init, attr))
             self._log("Copied from SN %d", _sn(init.__id))
             return
@@ -296,27 +434,33 @@ class FixedPoint:
         self._overflow = Overflow[overflow]
         self._rounding = Rounding[rounding]
 
-        self._log('%s\n'
-                  "intended: %r\n"
-                  "Q format: %s\n"
-                  "overflow: %s\n"
-                  "rounding: %s\n"
-                  "overflow_alert: %s\n"
-                  "mismatch_alert: %s\n"
-                  "implicit_cast_alert: %s\n"
-                  "str_base: %d",
-                  '-' * 80,
-                  init,
-                  self.qformat,
-                  self.overflow,
-                  self.rounding,
-                  self.overflow_alert,
-                  self.mismatch_alert,
-                  self.implicit_cast_alert,
-                  self.str_base)
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            self._log('%s\n'
+                      "intended: %r\n"
+                      "Q format: %s\n"
+                      "overflow: %s\n"
+                      "rounding: %s\n"
+                      "overflow_alert: %s\n"
+                      "mismatch_alert: %s\n"
+                      "implicit_cast_alert: %s\n"
+                      "str_base: %d",
+                      '-' * 80,
+                      init,
+                      self.qformat,
+                      self.overflow,
+                      self.rounding,
+                      self.overflow_alert,
+                      self.mismatch_alert,
+                      self.implicit_cast_alert,
+                      self.str_base)
 
         initialize(init)
-        self.trim(trim_m, trim_n)
+        if trim_m or trim_n:
+            self.trim(trim_m, trim_n)
+        else:
+            # Rounding down in from_float can leave sign bits beyond the word
+            # size, which trim would otherwise mask off.
+            self._bits &= _bitmask(self._m + self._n)
 
     def from_string(self: FixedPointType, string: str, /) -> None:
         """Initialize a FixedPoint object from a string literal.
@@ -328,7 +472,7 @@ class FixedPoint:
             raise TypeError(f"Expected {type('')}; got {type(string)}.")
 
         val = int(string, 0)
-        bits = val & self.bitmask
+        bits = val & _bitmask(self._m + self._n)
         if bits != val:
             raise ValueError("Superfluous bits detected in string literal "
                              f"{string!r} for {self.qformat} format.")
@@ -352,7 +496,7 @@ class FixedPoint:
         if not minimum <= bits <= maximum:
             self._owarn("Integer %d overflows in %s format.", integer,
                         self.qformat)
-            clamp = self._overflow == Overflow['clamp']
+            clamp = self._overflow is _CLAMP
             self._owarn("%s %s.", 'Clamped to' if clamp else 'Wrapped',
                         extreme := ('minimum' if integer < 0 else 'maximum'))
 
@@ -360,7 +504,7 @@ class FixedPoint:
             if clamp:
                 bits = getattr(self, f"_{extreme}")
 
-        self._bits = bits & self.bitmask
+        self._bits = bits & _bitmask(self._m + self._n)
 
     def from_float(self: FixedPointType, val: float, /) -> None:
         """Initialize a FixedPoint object from a floating point value.
@@ -371,14 +515,14 @@ class FixedPoint:
             raise TypeError(f"Expected {type(1.0)}; got {type(val)}.")
 
         # Shift fractional bits to the left of the binary point
-        bits = int(val * 2**self._n)
+        bits = int(scaled := val * 2**self._n)
 
         # Round if no need for clamping
         if self._minfloat <= val <= self._maxfloat:
-            bits &= self.bitmask
+            bits &= _bitmask(self._m + self._n)
             # Fake an extra 2 bits so we can use class methods for rounding
             n = self._n
-            if frac := abs(val * 2**n) % 1.0:
+            if frac := abs(scaled) % 1.0:
                 self._n = n + 2
                 bits <<= 2
                 if val < 0.0:
@@ -389,21 +533,21 @@ class FixedPoint:
                 if frac == 0.5:
                     bitmask = 0b10
                 self._bits = bits | bitmask
-                getattr(self, f"round_{self.rounding}")(n)
+                self._ROUND_DISPATCH[self._rounding._value_](self, n)
             else:
                 self._bits = bits
 
         # We must clamp
         else:
             self._owarn("%e overflows in %s format.", val, self.qformat)
-            clamp = self._overflow == Overflow['clamp']
+            clamp = self._overflow is _CLAMP
             self._owarn("%s %s.", 'Clamped to' if clamp else 'Wrapped',
                         extreme := ('minimum' if val < 0 else 'maximum'))
 
             if clamp:
                 bits = getattr(self, f'_{extreme}')
 
-            self._bits = bits & self.bitmask
+            self._bits = bits & _bitmask(self._m + self._n)
 
     ###########################################################################
     # Property accessors and mutators
@@ -435,7 +579,7 @@ class FixedPoint:
 
         # If we're currently signed, we underflow, otherwise we overflow.
         extreme = 'minimum' if signed else 'maximum'
-        clamp = self._overflow == Overflow['clamp']
+        clamp = self._overflow is _CLAMP
 
         # Generate warning
         self._owarn("Changing signedness on %s causes overflow.", self)
@@ -444,7 +588,8 @@ class FixedPoint:
         # Handle overflow
         self._signed = val
         if clamp:
-            self._bits = self.bitmask & getattr(self, f"_{extreme}")
+            self._bits = _bitmask(self._m + self._n) & \
+                (self._minimum if signed else self._maximum)
 
     # _________________________________________________________________________
     @property
@@ -472,11 +617,11 @@ class FixedPoint:
         # Number of integer bits are growing, do sign extension.
         if (nintbits := nbits - self._m) > 0 and self._negweight():
             shift = self._m + self._n
-            self._bits |= (2**nintbits - 1) << (self._m + self._n)
+            self._bits |= _bitmask(nintbits) << (self._m + self._n)
 
         # Number of integer bits are shrinking, handle overflow
         elif nintbits < 0:
-            getattr(self, self.overflow)(nbits)
+            self._OVERFLOW_DISPATCH[self._overflow._value_](self, nbits)
         self._m = int(nbits)
 
     # _________________________________________________________________________
@@ -602,12 +747,12 @@ class FixedPoint:
     @property
     def qformat(self: FixedPointType) -> str:
         """Q format indicating signedness, and integer/fractional bit width."""
-        return f"{'' if self._signed else 'U'}Q{self._m}.{self._n}"
+        return _qformat(bool(self._signed), self._m, self._n)
 
     @property
     def bitmask(self: FixedPointType) -> int:
         """Bitmask for the current Q format."""
-        return int(2**(self._m + self._n) - 1)
+        return _bitmask(self._m + self._n)
 
     @property
     def bits(self: FixedPointType) -> FixedPointBits:
@@ -624,17 +769,19 @@ class FixedPoint:
     @property
     def _minimum(self: FixedPointType) -> int:
         """Minimum representable bit value."""
-        return int(2**(self._m + self._n - 1) * -bool(self._signed))
+        return -(1 << (self._m + self._n - 1)) if self._signed else 0
 
     @property
     def _maximum(self: FixedPointType) -> int:
         """Maximum representable bit value."""
-        return int(2**(self._m + self._n - bool(self._signed)) - 1)
+        return (1 << (self._m + self._n - bool(self._signed))) - 1
 
     @property
     def _signedint(self: FixedPointType) -> int:
         """Signed version of _bits."""
-        return (self._bits & self._maximum) + self._negweight()
+        nbits = self._m + self._n
+        return cast(int, _signedint(self._bits & ((1 << nbits) - 1),
+                                    self._signed, nbits))
 
     @property
     def _maxfloat(self: FixedPointType) -> float:
@@ -653,8 +800,7 @@ class FixedPoint:
         signed = bool(self._signed if signed is None else signed)
         m = self._m if m is None else m
         n = self._n if n is None else n
-        ret = 2**(m + n - 1) & bits
-        return int(ret * -signed)
+        return -((1 << (m + n - 1)) & bits) if signed else 0
 
     def _posweight(self: FixedPointType, bits: int = None,
                    signed: bool = None, m: int = None, n: int = None) -> int:
@@ -663,8 +809,7 @@ class FixedPoint:
         signed = bool(self._signed if signed is None else signed)
         m = self._m if m is None else m
         n = self._n if n is None else n
-        mask = 2**(m + n - signed) - 1
-        return int(mask & bits)
+        return ((1 << (m + n - signed)) - 1) & bits
 
     ###########################################################################
     # Operators
@@ -700,61 +845,57 @@ class FixedPoint:
         return ret
 
     def __to_FixedPoint_resolved(self: FixedPointType, num: Numeric,
-                                 signed: bool = None) -> Tuple[FixedPointType,
-                                                               ResolvedProps]:
-        """Return a FixedPoint version of num, with resolved properties."""
-        props: ResolvedProps = (self.__class__._RESOLVE.all(self, num)
-                                if isinstance(num, self.__class__) else
-                                self.__class__._RESOLVE.all(self))
-        return self.__to_FixedPoint(num, signed), props
+                                 signed: bool = None) -> \
+            Tuple[FixedPointType, Optional[ResolvedProps]]:
+        """Return a FixedPoint version of num, with resolved properties.
+
+        The properties are None when the result takes on the properties of
+        self, i.e., when num is not a FixedPoint or its properties match.
+        NotImplemented is returned for operands that opt out of numpy ufuncs
+        (e.g., FixedPointArray), so their reflected operators are used.
+        """
+        if isinstance(num, self.__class__):
+            if self.__alike(num):
+                return num, None
+            return num, self.__class__._RESOLVE.all(self, num)
+        if getattr(num.__class__, '__array_ufunc__', 0) is None:
+            return NotImplemented, None
+        return self.__to_FixedPoint(num, signed), None
+
+    def __alike(self: FixedPointType, other: Any) -> bool:
+        """Determine if other is a FixedPoint with the same properties."""
+        return other.__class__ is self.__class__ and \
+            _property_members(other) == _property_members(self)
 
     def __add(augend: FixedPointType, addend: FixedPointType) -> AttrReturn:
         """Perform addition and return attributes of the result."""
-        with augend, addend:
-            # Determine the Q format of the sum
-            n: int = max(augend._n, addend._n)
-            m: int = max(augend._m, addend._m) + 1
-            signed: bool = bool(augend._signed or addend._signed)
-
-            # Align binary points
-            augend.n, addend.n = n, n
-
-            # Sum some
-            bits: int = (2**(m + n) - 1) & \
-                (augend._posweight() + addend._posweight() +
-                 augend._negweight() + addend._negweight())
-
-        return bits, signed, m, n
+        return _add_bits(augend._bits, augend._signed, augend._m, augend._n,
+                         addend._bits, addend._signed, addend._m, addend._n)
 
     def __add__(self: FixedPointType, other: Numeric) -> FixedPointType:
         """Full precision addition operator."""
         fother, props = self.__to_FixedPoint_resolved(other)
+        if fother is NotImplemented:
+            return NotImplemented
+        if props is None:
+            return self.__new_like(*self.__add(fother))
         return self.__class__.__new(*self.__add(fother), **props)
 
     def __iadd__(self: FixedPointType, addend: Numeric) -> FixedPointType:
         """Full precision augmented addition operator."""
         other = self.__to_FixedPoint(addend)
-        self._bits, self._signed, self._m, self._n = self.__add(other)
+        self._bits, self._signed, self._m, self._n = _add_bits(
+            self._bits, self._signed, self._m, self._n,
+            other._bits, other._signed, other._m, other._n)
         return self
 
     def __sub(minuend: FixedPointType, subtrahend: FixedPointType,
               overflow: str, owarner: Callable[..., None]) -> AttrReturn:
         """Perform subtraction and return attributes of the result."""
-        with minuend, subtrahend:
-            # Determine the Q format of the difference
-            signed: bool = minuend._signed or subtrahend._signed
-            sign_mismatch: bool = minuend._signed ^ subtrahend._signed
-            m: int = 1 + max(minuend._m, subtrahend._m) + sign_mismatch
-            n: int = max(minuend._n, subtrahend._n)
-
-            # Align binary points and properties
-            minuend.resize(m, n)
-            subtrahend.resize(m, n)
-            minuend._signed, subtrahend._signed = signed, signed
-
-            # Subtract some
-            bits: int = minuend._posweight() + minuend._negweight() \
-                - subtrahend._posweight() - subtrahend._negweight()
+        bits, signed, m, n = _sub_bits(minuend._bits, minuend._signed,
+                                       minuend._m, minuend._n,
+                                       subtrahend._bits, subtrahend._signed,
+                                       subtrahend._m, subtrahend._n)
 
         # Check overflow condition
         if not signed and bits < 0:
@@ -763,11 +904,16 @@ class FixedPoint:
                 bits = 0
             owarner("%s minimum.", "Clamped to" if clamp else "Wrapped")
 
-        return bits & (2**(m + n) - 1), signed, m, n
+        return bits & _bitmask(m + n), signed, m, n
 
     def __sub__(self: FixedPointType, other: Numeric) -> FixedPointType:
         """Full precision subtraction operator."""
         subtrahend, props = self.__to_FixedPoint_resolved(other, self._signed)
+        if subtrahend is NotImplemented:
+            return NotImplemented
+        if props is None:
+            return self.__new_like(*self.__sub(subtrahend, self.overflow,
+                                               subtrahend._owarn))
 
         # Because overflow may occur, make sure the object with the highest
         # priority overflow_alert is used for the warning.
@@ -780,12 +926,7 @@ class FixedPoint:
     def __rsub__(self: FixedPointType, minuend: Numeric) -> FixedPointType:
         """Full precision reflected subtraction."""
         other = self.__to_FixedPoint(minuend, self._signed)
-        return self.__class__.__new(*other.__sub(self, self.overflow,
-                                                 self._owarn),
-                                    self.overflow, self.rounding, self.str_base,
-                                    self.overflow_alert,
-                                    self.implicit_cast_alert,
-                                    self.mismatch_alert)
+        return self.__new_like(*other.__sub(self, self.overflow, self._owarn))
 
     def __isub__(self: FixedPointType, subtrahend: Numeric) -> FixedPointType:
         """Full precision augmented subtraction operator."""
@@ -797,21 +938,26 @@ class FixedPoint:
     def __mul(multiplicand: FixedPointType,
               multiplier: FixedPointType) -> AttrReturn:
         """Perform multiplication and return attributes of the result."""
-        m: int = multiplicand._m + multiplier._m
-        n: int = multiplicand._n + multiplier._n
-        signed: bool = bool(multiplicand._signed or multiplier._signed)
-        bits = multiplicand._signedint * multiplier._signedint
-        return bits & (2**(m + n) - 1), signed, m, n
+        return _mul_bits(multiplicand._bits, multiplicand._signed,
+                         multiplicand._m, multiplicand._n,
+                         multiplier._bits, multiplier._signed,
+                         multiplier._m, multiplier._n)
 
     def __mul__(self: FixedPointType, other: Numeric) -> FixedPointType:
         """Full precision multiplication operator."""
         multiplier, props = self.__to_FixedPoint_resolved(other)
+        if multiplier is NotImplemented:
+            return NotImplemented
+        if props is None:
+            return self.__new_like(*self.__mul(multiplier))
         return self.__class__.__new(*self.__mul(multiplier), **props)
 
     def __imul__(self: FixedPointType, multiplier: Numeric) -> FixedPointType:
         """Full precision augmented multiplication operator."""
         other = self.__to_FixedPoint(multiplier)
-        self._bits, self._signed, self._m, self._n = self.__mul(other)
+        self._bits, self._signed, self._m, self._n = _mul_bits(
+            self._bits, self._signed, self._m, self._n,
+            other._bits, other._signed, other._m, other._n)
         return self
 
     def __pow(self: FixedPointType, exponent: int) -> AttrReturn:
@@ -822,15 +968,17 @@ class FixedPoint:
         m: int = self._m * exponent
         n: int = self._n * exponent
         signed: bool = self._signed
-        return self._signedint**exponent & (2**(m + n) - 1), signed, m, n
+
+        # The result is full precision, so masking intermediate products would
+        # not make them any smaller; only negative powers need masking.
+        bits: int = _signedint(self._bits, signed, self._m + self._n)**exponent
+        if bits < 0:
+            bits &= _bitmask(m + n)
+        return bits, signed, m, n
 
     def __pow__(self: FixedPointType, exponent: int) -> FixedPointType:
         """Full precision exponentiation operator."""
-        return self.__class__.__new(*self.__pow(exponent), self.overflow,
-                                    self.rounding, self.str_base,
-                                    self.overflow_alert,
-                                    self.implicit_cast_alert,
-                                    self.mismatch_alert)
+        return self.__new_like(*self.__pow(exponent))
 
     def __ipow__(self: FixedPointType, exponent: int) -> FixedPointType:
         """Full precision augmented exponentiation operator."""
@@ -841,17 +989,15 @@ class FixedPoint:
         """Perform bit shifting and return the new bits."""
         if not isinstance(nbits, int):
             raise TypeError(f"Expected {type(1)}; got {type(nbits)}.")
-        shift = operator.lshift if nbits < 0 else operator.rshift
-        return cast(int, shift(self._signedint, abs(nbits)) & self.bitmask)
+        nword = self._m + self._n
+        bits = _signedint(self._bits, self._signed, nword)
+        bits = bits << -nbits if nbits < 0 else bits >> nbits
+        return cast(int, bits & _bitmask(nword))
 
     def __lshift__(self: FixedPointType, nbits: int) -> FixedPointType:
         """Literal left shift."""
-        return self.__class__.__new(self.__bitshift(-nbits), self._signed,
-                                    self._m, self._n, self.overflow,
-                                    self.rounding, self.str_base,
-                                    self.overflow_alert,
-                                    self.implicit_cast_alert,
-                                    self.mismatch_alert)
+        return self.__new_like(self.__bitshift(-nbits), self._signed,
+                               self._m, self._n)
 
     def __ilshift__(self: FixedPointType, nbits: int) -> FixedPointType:
         """Augmented literal left shift."""
@@ -860,12 +1006,8 @@ class FixedPoint:
 
     def __rshift__(self: FixedPointType, nbits: int) -> FixedPointType:
         """Literal right shift."""
-        return self.__class__.__new(self.__bitshift(+nbits), self._signed,
-                                    self._m, self._n, self.overflow,
-                                    self.rounding, self.str_base,
-                                    self.overflow_alert,
-                                    self.implicit_cast_alert,
-                                    self.mismatch_alert)
+        return self.__new_like(self.__bitshift(+nbits), self._signed,
+                               self._m, self._n)
 
     def __irshift__(self: FixedPointType, nbits: int) -> FixedPointType:
         """Augmented literal right shift."""
@@ -887,17 +1029,13 @@ class FixedPoint:
     def __bitwise(self: FixedPointType, operand: Integral,
                   operate: Callable[[int, int], int]) -> int:
         """Bitwise operator on integer or FixedPoint types."""
-        return operate(self._bits,
-                       self.__class__.__getbits(operand)) & self.bitmask
+        return operate(self._bits, self.__class__.__getbits(operand)) & \
+            _bitmask(self._m + self._n)
 
     def __and__(self: FixedPointType, other: Integral) -> FixedPointType:
         """Bitwise AND."""
-        return self.__class__.__new(self.__bitwise(other, operator.__and__),
-                                    self._signed, self._m, self._n,
-                                    self.overflow, self.rounding,
-                                    self.str_base, self.overflow_alert,
-                                    self.implicit_cast_alert,
-                                    self.mismatch_alert)
+        return self.__new_like(self.__bitwise(other, operator.__and__),
+                               self._signed, self._m, self._n)
 
     def __iand__(self: FixedPointType, other: Integral) -> FixedPointType:
         """Augmented bitwise AND."""
@@ -906,12 +1044,8 @@ class FixedPoint:
 
     def __or__(self: FixedPointType, other: Integral) -> FixedPointType:
         """Bitwise OR."""
-        return self.__class__.__new(self.__bitwise(other, operator.__or__),
-                                    self._signed, self._m, self._n,
-                                    self.overflow, self.rounding,
-                                    self.str_base, self.overflow_alert,
-                                    self.implicit_cast_alert,
-                                    self.mismatch_alert)
+        return self.__new_like(self.__bitwise(other, operator.__or__),
+                               self._signed, self._m, self._n)
 
     def __ior__(self: FixedPointType, other: Integral) -> FixedPointType:
         """Augmented bitwise OR."""
@@ -920,12 +1054,8 @@ class FixedPoint:
 
     def __xor__(self: FixedPointType, other: Integral) -> FixedPointType:
         """Bitwise XOR."""
-        return self.__class__.__new(self.__bitwise(other, operator.__xor__),
-                                    self._signed, self._m, self._n,
-                                    self.overflow, self.rounding,
-                                    self.str_base, self.overflow_alert,
-                                    self.implicit_cast_alert,
-                                    self.mismatch_alert)
+        return self.__new_like(self.__bitwise(other, operator.__xor__),
+                               self._signed, self._m, self._n)
 
     def __ixor__(self: FixedPointType, other: Integral) -> FixedPointType:
         """Augmented bitwise XOR."""
@@ -955,13 +1085,9 @@ class FixedPoint:
             self._owarn("Adjusting Q format to Q%d.%d to allow negation.",
                         self._m + 1, self._n)
 
-        ret = self.__class__.__new(0, True, self._m, self._n, self.overflow,
-                                   self.rounding, self.str_base,
-                                   self.overflow_alert,
-                                   self.implicit_cast_alert,
-                                   self.mismatch_alert)
-        ret._bits, ret._signed, ret._m, ret._n = \
-            ret.__sub(self, 'clamp', ret._owarn)
+        # Negate with one extra integer bit, which always fits
+        m, n = self._m + 1, self._n
+        ret = self.__new_like(-self._signedint & _bitmask(m + n), True, m, n)
         if not overflow:
             ret.clamp(self._m, alert='error')
 
@@ -969,40 +1095,51 @@ class FixedPoint:
 
     def __pos__(self: FixedPointType) -> FixedPointType:
         """Unary positive."""
-        return self.__class__.__new(self._bits, self._signed, self._m,
-                                    self._n, self.overflow,
-                                    self.rounding, self.str_base,
-                                    self.overflow_alert,
-                                    self.implicit_cast_alert,
-                                    self.mismatch_alert)
+        return self.__new_like(self._bits, self._signed, self._m, self._n)
 
     def __invert__(self: FixedPointType) -> FixedPointType:
         """Unary bitwise inversion."""
-        return self.__class__.__new(self.bitmask & ~self._bits, self._signed,
-                                    self._m, self._n, self.overflow,
-                                    self.rounding, self.str_base,
-                                    self.overflow_alert,
-                                    self.implicit_cast_alert,
-                                    self.mismatch_alert)
+        return self.__new_like(_bitmask(self._m + self._n) & ~self._bits,
+                               self._signed, self._m, self._n)
 
     # _________________________________________________________________________
     # Comparison operators
     def __cmp__(self: FixedPointType, other: Numeric) -> int:
         """Python 2 style comparison operator."""
-        fother: FixedPointType = self.__to_FixedPoint(other)
-
-        # Force a signed subtraction - grow by one bit temporarily to safely
-        # convert to a signed number if needed
-        with self(mismatch_alert='ignore', m=self._m + 1, signed=1) as left:
-            args = left.__sub(fother, '', self._owarn)
-        return self._posweight(*args) + self._negweight(*args)
+        fother: FixedPointType
+        # Binary points are already aligned in the same Q format
+        if self.__same_qformat(other):
+            fother, nbits = cast(FixedPointType, other), self._m + self._n
+            return cast(int, _signedint(self._bits, self._signed, nbits) -
+                        _signedint(fother._bits, self._signed, nbits))
+
+        fother = self.__to_FixedPoint(other)
+
+        # Align the binary points and subtract the signed integer values. The
+        # difference can't overflow, so no Q format handling is necessary.
+        n = self._n if self._n > fother._n else fother._n
+        left = _signedint(self._bits, self._signed, self._m + self._n)
+        right = _signedint(fother._bits, fother._signed, fother._m + fother._n)
+        return cast(int, (left << (n - self._n)) - (right << (n - fother._n)))
+
+    def __same_qformat(self: FixedPointType, other: Any) -> bool:
+        """Determine if other is a FixedPoint in the same Q format."""
+        return other is self or (other.__class__ is self.__class__ and
+                                 other._m == self._m and
+                                 other._n == self._n and
+                                 other._signed == self._signed)
 
     def __eq__(self: FixedPointType, other: Any) -> bool:
         """Equality comparison operator."""
+        # Values in the same Q format are equal iff their bits are
+        if self.__same_qformat(other):
+            return bool(self._bits == other._bits)
         return self.__cmp__(other) == 0
 
     def __ne__(self: FixedPointType, other: Any) -> bool:
         """Non-equality comparison operator."""
+        if self.__same_qformat(other):
+            return bool(self._bits != other._bits)
         return self.__cmp__(other) != 0
 
     def __lt__(self: FixedPointType, other: Any) -> bool:
@@ -1055,8 +1192,10 @@ class FixedPoint:
 
     def __enter__(self: FixedPointType) -> FixedPointType:
         """Save the current attributes for later restoration."""
-        # Push the current context onto the context manager stack
-        self.__cmstack.append(DEFAULT_ENCODER.encode(self))
+        # Push the current attributes onto the context manager stack. They're
+        # only kept in memory, so there's no need to serialize them.
+        self.__cmstack.append(tuple(getattr(self, attr)
+                                    for attr in self._COPYSLOTS))
         # Push the safe_retain option to the context manager stack
         self.__cmstack.append(self.__context.pop('safe_retain', False))
 
@@ -1067,11 +1206,9 @@ class FixedPoint:
                 # To assign the value to the attribute, go through the property
                 # setter function if it exists, which validates and normalizes
                 # the value to the correct type (e.g., @signed.setter ensures
-                # it's a bool). Filched from
-                # https://stackoverflow.com/questions/3681272/can-i-get-a-reference-to-a-python-property
-                prop = self.__class__.__dict__.get(attr[1:], None)
-                if isinstance(prop, property) and bool(prop.fset):
-                    prop.fset(self, value)  # type: ignore
+                # it's a bool).
+                if fset := _PROPERTY_SETTERS.get(attr[1:]):
+                    fset(self, value)
                 else:
                     raise PermissionError(f"{attr[1:]!r} is read-only.")
         finally:
@@ -1095,13 +1232,8 @@ class FixedPoint:
             self.__cmstack.pop()
             return
 
-        # See the FixedPointEncoder.default method in .\json.py for the
-        # serialization order of FixedPoint object attributes.
-        attributes = DEFAULT_DECODER.decode_attributes(self.__cmstack.pop())
-        self._bits = attributes.pop()
-        self._signed, self._m, self._n = attributes.pop()
-        for attr, value in attributes.pop().items():
-            self.__class__.__dict__[attr].fset(self, value)
+        for attr, value in zip(self._COPYSLOTS, self.__cmstack.pop()):
+            setattr(self, attr, value)
 
     ###########################################################################
     # Built-in functions and type conversion
@@ -1115,12 +1247,7 @@ class FixedPoint:
         if self._negweight():
             ret = -self
         else:
-            ret = self.__class__.__new(self._bits, self._signed, self._m,
-                                       self._n, self.overflow,
-                                       self.rounding, self.str_base,
-                                       self.overflow_alert,
-                                       self.implicit_cast_alert,
-                                       self.mismatch_alert)
+            ret = self.__new_like(self._bits, self._signed, self._m, self._n)
         return ret
 
     def __int__(self: FixedPointType) -> int:
@@ -1149,62 +1276,62 @@ class FixedPoint:
         Use the str_base property to adjust which base to use for this function.
         For str_base of 2, 8, or 16, output is 0-padded to the bit width.
         """
-        ret = StrConv[self.str_base](self._bits)
+        base = self._str_base.value
+        ret = StrConv[base](self._bits)
         # Zero padding
-        if self.str_base == 10:
+        if base == 10:
             return ret
 
         # Remove radix
         ret = ret[2:]
         bits_needed = self._m + self._n
-        nzeros = _ceil(bits_needed / _log2(self.str_base))
+        nzeros = -(-bits_needed // _DIGIT_BITS[base])
         return ret.zfill(nzeros)
 
     def __format__(self: FixedPointType, spec: str) -> str:
         """Format as a string."""
+        # Default formatting (e.g., f"{x}") is the decimal value of the bits
+        if not spec:
+            return str(self._bits)
+
+        kind, spec = _parse_format_spec(spec)
         # All bits
-        if spec == '' or spec[-1] in 'bdoxX' or spec is None:
+        if kind == 'bits':
             ret = format(self._bits, spec)
 
         # Integer bits
-        elif spec[-1] in 'm':
-            ret = format((self._bits >> self._n) & (2**self._m - 1), spec[:-1])
+        elif kind == 'm':
+            ret = format((self._bits >> self._n) & _bitmask(self._m), spec)
 
         # Fractional bits
-        elif spec[-1] in 'n':
-            ret = format(self._bits & (2**self._n - 1), spec[:-1])
+        elif kind == 'n':
+            ret = format(self._bits & _bitmask(self._n), spec)
 
         # str()
-        elif spec[-1] in 's':
+        elif kind == 's':
             ret = format(str(self), spec)
 
         # float()
-        elif spec[-1] in 'eEfFgG%':
+        elif kind == 'float':
             ret = format(float(self), spec)
 
         # qformat
-        elif spec[-1] == 'q':
-            ret = format(self.qformat, f"{spec[:-1]}s")
-
         else:
-            raise ValueError(f"Unknown format code {spec!r}.")
+            ret = format(self.qformat, spec)
 
         return ret
 
     def __repr__(self: FixedPointType) -> str:
         """Python-executable code string, allows for exact reproduction."""
-        str_base = self.str_base
-        return (
-            f"FixedPoint({StrConv[str_base](self._bits)!r}, "
-            f"signed={int(self._signed)}, "
-            f"m={self._m}, "
-            f"n={self._n}, "
-            f"overflow={self.overflow!r}, "
-            f"rounding={self.rounding!r}, "
-            f"overflow_alert={self.overflow_alert!r}, "
-            f"mismatch_alert={self.mismatch_alert!r}, "
-            f"implicit_cast_alert={self.implicit_cast_alert!r}, "
-            f"{str_base=})")
+        str_base = self._str_base._value_
+        return _REPR_TEMPLATE % (StrConv[str_base](self._bits),
+                                 int(self._signed), self._m, self._n,
+                                 self._overflow._name_,
+                                 self._rounding._name_,
+                                 self._overflow_alert._name_,
+                                 self._mismatch_alert._name_,
+                                 self._implicit_cast_alert._name_,
+                                 str_base)
 
     ###########################################################################
     # Bit resizing methods
@@ -1218,17 +1345,25 @@ class FixedPoint:
         Override rounding, overflow, and overflow_alert settings for the
         scope of this method by specifying the appropriate arguments.
         """
+        # Nothing to resize, and no overrides to validate
+        if m == self._m and n == self._n and isinstance(m, int) and \
+                isinstance(n, int) and rounding is overflow is alert is None:
+            return
+
+        # Snapshot attributes directly rather than through a context, which
+        # would serialize the whole object.
         old = self._overflow, self._rounding, self._overflow_alert
+        qformat = self._bits, self._signed, self._m, self._n
+        self.overflow = overflow or self.overflow
+        self.rounding = rounding or self.rounding
+        self.overflow_alert = alert or self.overflow_alert
         try:
-            with self(safe_retain=True,
-                      overflow=overflow or self.overflow,
-                      rounding=rounding or self.rounding,
-                      overflow_alert=alert or self.overflow_alert):
-                self.n = n
-                self.m = m
+            self.n = n
+            self.m = m
         except Exception:
+            self._bits, self._signed, self._m, self._n = qformat
             raise
-        else:
+        finally:
             self._overflow, self._rounding, self._overflow_alert = old
 
     def trim(self: FixedPointType, /, ints: bool = None,
@@ -1245,19 +1380,21 @@ class FixedPoint:
 
         s, m, n = bool(self._signed), self._m, self._n
         # Trailing 0s on fractional bits can be stripped
-        if fracs:
-            n = len(self.bits['N'].rstrip('0')) if n else 0
+        if fracs and (fbits := self._bits & _bitmask(n)):
+            n -= (fbits & -fbits).bit_length() - 1
+        elif fracs:
+            n = 0
 
         if ints:
+            mbits = (self._bits >> self._n) & (mask := _bitmask(self._m))
             # Remove leading 1s for negative numbers, leave 1 though
             if self._signedint < 0:
-                m = 1 + len(self.bits['M'].lstrip('1'))
+                m = 1 + (mbits ^ mask).bit_length()
             # Remove all leading 0s
             # For signed, minimum m is 1
             # For unsigned, m can be 0 iff n is non-zero
             elif self._m:
-                m = max(s or n == 0,
-                        s + len(self.bits['M'].lstrip('0')))
+                m = max(s or n == 0, s + mbits.bit_length())
             else:
                 m = self._m
 
@@ -1270,7 +1407,7 @@ class FixedPoint:
         self._bits >>= (self._n - n)
         self._n = n
         self._m = int(m or n == 0)
-        self._bits &= self.bitmask
+        self._bits &= _bitmask(self._m + self._n)
 
     # _________________________________________________________________________
     # Rounding methods
@@ -1288,113 +1425,84 @@ class FixedPoint:
                              "must be in the range "
                              f"[{int(self._m == 0)}, {self._n}).")
 
+    # Used by FixedPointArray
+    _rounding_arg_check = __rounding_arg_check
+
+    def __round_off(self: FixedPointType, bits: int, nfrac: int,
+                    must_round: Any, overflow_msg: str) -> None:
+        """Increment truncated bits if needed and store the rounded result."""
+        # Check for overflow before rounding
+        if must_round:
+            maximum = _bitmask(self._m - bool(self._signed) + nfrac)
+            if bits == maximum:
+                self._owarn(overflow_msg, self.qformat.split('.')[0], nfrac)
+                clamp = self._overflow is _CLAMP
+                self._owarn("%s maximum.", 'Clamped to' if clamp else "Wrapped")
+
+                # If we need to clamp, set the value to 1 less than the max,
+                # we will add the rounding bit later
+                if clamp:
+                    bits = maximum - 1
+
+            bits += 1
+
+        self._n = nfrac
+        self._bits = bits & _bitmask(self._m + nfrac)
+
     def __round__(self: FixedPointType, nfrac: int, /) -> FixedPointType:
         """Fractional rounding. This is the "round()" function.
 
         The rounding method used by this function is specified by the
         rounding attribute of this object.
         """
-        ret: FixedPointType = self.__class__.__new(self._bits, self._signed,
-                                                   self._m, self._n,
-                                                   self.overflow,
-                                                   self.rounding, self.str_base,
-                                                   self.overflow_alert,
-                                                   self.implicit_cast_alert,
-                                                   self.mismatch_alert)
+        ret: FixedPointType = self.__new_like(self._bits, self._signed,
+                                              self._m, self._n)
         ret.round(nfrac)
         return ret
 
     def __floor__(self: FixedPointType) -> FixedPointType:
         """Round to negative infinity, leave fractional bit width unmodified."""
         # When binary bits are truncated, it rounds to negative infinity.
-        ret = self.__class__.__new(self._bits, self._signed, self._m,
-                                   self._n, self.overflow,
-                                   self.rounding, self.str_base,
-                                   self.overflow_alert,
-                                   self.implicit_cast_alert,
-                                   self.mismatch_alert)
-        if self._n:
-            ret._bits &= ~(2**self._n - 1) & self.bitmask
-        return ret
+        bits = self._bits & ~_bitmask(self._n) if self._n else self._bits
+        return self.__new_like(bits, self._signed, self._m, self._n)
 
     def __ceil__(self: FixedPointType) -> FixedPointType:
         """Round to positive infinity, leaving 0 fractional bits."""
-        ret = self.__class__.__new(self._bits, self._signed, self._m,
-                                   self._n, self.overflow,
-                                   self.rounding, self.str_base,
-                                   self.overflow_alert,
-                                   self.implicit_cast_alert,
-                                   self.mismatch_alert)
+        ret = self.__new_like(self._bits, self._signed, self._m, self._n)
         ret.round_up(0)
         return ret
 
     def __trunc__(self: FixedPointType) -> FixedPointType:
         """Truncate all fractional bits. Adds an integer bit if needed."""
-        ret = self.__class__.__new(self._bits, self._signed, self._m,
-                                   self._n, self.overflow,
-                                   self.rounding, self.str_base,
-                                   self.overflow_alert,
-                                   self.implicit_cast_alert,
-                                   self.mismatch_alert)
-        ret._bits >>= ret._n
-        ret._n = 0
         # Signed numbers are guaranteed to have at least 1 integer bit. Unsigned
         # numbers are not
-        ret._m = ret._m or 1
-        return ret
+        return self.__new_like(self._bits >> self._n, self._signed,
+                               self._m or 1, 0)
 
     def round(self: FixedPointType, nfrac: int, /) -> None:
         """Round with the default setting."""
-        getattr(self, f"round_{self.rounding}")(nfrac)
+        self._ROUND_DISPATCH[self._rounding._value_](self, nfrac)
 
     def convergent(self: FixedPointType, nfrac: int, /) -> None:
         """Round half to even."""
         self.__rounding_arg_check(nfrac)
 
-        m, n, bits = self._m, self._n, self._bits
+        n, bits = self._n, self._bits
 
+        # Truncate bits
         num_bits_truncated = n - nfrac
-        # Determine if we need to round
-        must_round = False
-        # The most significant fractional bit
-        msb_frac = 2**(num_bits_truncated - 1) & bits
-        # Least significant integer bit
-        lsb_int = 2**num_bits_truncated & bits
-
-        # There are multiple fractional bits to be rounded off
-        if num_bits_truncated > 1:
-            # Least significant fractional bits
-            lsb_fracs = (2**(n - nfrac - 1) - 1) & bits
-            # If the most significant fractional bit is 1, round if the number
-            # is odd or remaining fractional bits are non-zero
-            must_round = msb_frac and (lsb_fracs or lsb_int)
-        # This is only one fractional bit; round iff the number is odd and
-        # fractional bit is '1'
-        else:
-            must_round = msb_frac and lsb_int
-
-        # Get rid of the bits we don't want
-        bits >>= n - nfrac
-        n = nfrac
-        maximum = 2**(m - bool(self._signed) + n) - 1
-
-        # Check for overflow before rounding
-        if must_round:
-            if bits == maximum:
-                self._owarn("Convergent round to %s.%d causes overflow.",
-                            self.qformat.split('.')[0], n)
-                clamp = self._overflow == Overflow['clamp']
-                self._owarn("%s maximum.", 'Clamped to' if clamp else "Wrapped")
-
-                # If we need to clamp, set the value to 1 less than the max,
-                # we will add the rounding bit later
-                if clamp:
-                    bits = maximum - 1
+        truncated_bits = bits & _bitmask(num_bits_truncated)
+        tie_threshold = 1 << (num_bits_truncated - 1)
+        bits >>= num_bits_truncated
 
-            bits += 1
+        # Round above a tie, and round ties iff the number is odd
+        if truncated_bits == tie_threshold:
+            must_round = bits & 1
+        else:
+            must_round = truncated_bits > tie_threshold
 
-        self._n = n
-        self._bits = bits & self.bitmask
+        self.__round_off(bits, nfrac, must_round,
+                         "Convergent round to %s.%d causes overflow.")
 
     # Add a round_ prefix in front of rounding functions for generic rounding
     # attribute access
@@ -1409,117 +1517,60 @@ class FixedPoint:
         # For negative numbers add one to truncated result if truncated bits
         # are non-zero
         num_bits_truncated = n - nfrac
-        truncated_bits = bits & (2**num_bits_truncated - 1)
+        truncated_bits = bits & _bitmask(num_bits_truncated)
         bits >>= num_bits_truncated
         bits += bool(self._signedint < 0) and bool(truncated_bits)
         self._n = nfrac
-        self._bits = bits & self.bitmask
+        self._bits = bits & _bitmask(self._m + self._n)
 
     def round_out(self: FixedPointType, nfrac: int) -> None:
         """Round half away from zero."""
         self.__rounding_arg_check(nfrac)
 
-        m, n, bits = self._m, self._n, self._bits
+        n, bits = self._n, self._bits
 
         # Truncate bits
         num_bits_truncated = n - nfrac
-        truncated_bits = bits & (2**num_bits_truncated - 1)
+        truncated_bits = bits & _bitmask(num_bits_truncated)
         tie_threshold = 1 << (num_bits_truncated - 1)
         if truncated_bits == tie_threshold:
             must_round = self._signedint > 0
         else:
             must_round = truncated_bits > tie_threshold
 
-        bits >>= num_bits_truncated
-        n = nfrac
-        maximum = 2**(m - bool(self._signed) + n) - 1
-
-        # Check for overflow before rounding
-        if must_round:
-            if bits == maximum:
-                self._owarn("Rounding out to %s.%d causes overflow.",
-                            self.qformat.split('.')[0], n)
-                clamp = self._overflow == Overflow['clamp']
-                self._owarn("%s maximum.", 'Clamped to' if clamp else "Wrapped")
-
-                # If we need to clamp, set the value to 1 less than the max,
-                # we will add the rounding bit later
-                if clamp:
-                    bits = maximum - 1
-
-            bits += 1
-
-        self._n = n
-        self._bits = bits & self.bitmask
+        self.__round_off(bits >> num_bits_truncated, nfrac, must_round,
+                         "Rounding out to %s.%d causes overflow.")
 
     def round_nearest(self: FixedPointType, nfrac: int, /) -> None:
         """Round half up."""
         self.__rounding_arg_check(nfrac)
 
-        m, n, bits = self._m, self._n, self._bits
+        n, bits = self._n, self._bits
 
         # Truncate bits
         num_bits_truncated = n - nfrac
-        truncated_bits = bits & (2**num_bits_truncated - 1)
+        truncated_bits = bits & _bitmask(num_bits_truncated)
         tie_threshold = 1 << (num_bits_truncated - 1)
-        bits >>= num_bits_truncated
-        n = nfrac
-        maximum = 2**(m - bool(self._signed) + n) - 1
 
         # Ties or greater round up
-        must_round = truncated_bits >= tie_threshold
-
-        # Check for overflow before rounding
-        if must_round:
-            if bits == maximum:
-                self._owarn("Rounding to nearest %s.%d causes overflow.",
-                            self.qformat.split('.')[0], n)
-                clamp = self._overflow == Overflow['clamp']
-                self._owarn("%s maximum.", 'Clamped to' if clamp else "Wrapped")
-
-                # If we need to clamp, set the value to 1 less than the max,
-                # we will add the rounding bit later
-                if clamp:
-                    bits = maximum - 1
-
-            bits += 1
-
-        self._n = n
-        self._bits = bits & self.bitmask
+        self.__round_off(bits >> num_bits_truncated, nfrac,
+                         truncated_bits >= tie_threshold,
+                         "Rounding to nearest %s.%d causes overflow.")
 
     def round_up(self: FixedPointType, nfrac: int, /) -> None:
         """Round towards infinity."""
         self.__rounding_arg_check(nfrac)
 
-        m, n, bits = self._m, self._n, self._bits
+        n, bits = self._n, self._bits
 
         # Truncate bits
         num_bits_truncated = n - nfrac
-        truncated_bits = bits & (2**num_bits_truncated - 1)
-        bits >>= num_bits_truncated
-        n = nfrac
-        maximum = 2**(m - bool(self._signed) + n) - 1
+        truncated_bits = bits & _bitmask(num_bits_truncated)
 
         # Any non-zero truncated bits round up
-        must_round = bool(truncated_bits)
-
-        # Check for overflow before rounding
-        if must_round:
-            if bits == maximum:
-                self._owarn("Rounding up to %s.%d causes overflow.",
-                            self.qformat.split('.')[0], n)
-                clamp = self._overflow == Overflow['clamp']
-                self._owarn("%s maximum.", 'Clamped to' if clamp else "Wrapped")
-
-                # If we need to clamp, set the value to 1 less than the max,
-                # we will add the rounding bit later
-                if clamp:
-                    bits = maximum - 1
-
-            bits += 1
-
-        self._n = n
-        self._bits = bits & self.bitmask
+        self.__round_off(bits >> num_bits_truncated, nfrac,
+                         bool(truncated_bits),
+                         "Rounding up to %s.%d causes overflow.")
 
     def round_down(self: FixedPointType, nfrac: int, /) -> None:
         """Round towards negative infinity."""
@@ -1546,15 +1597,21 @@ class FixedPoint:
                              f"{self._m + self._n}).")
 
         old = self._overflow, self._overflow_alert
-        with self(safe_retain=True,
-                  overflow=overflow or self.overflow,
-                  overflow_alert=alert or self.overflow_alert):
+        qformat = self._bits, self._signed, self._m, self._n
+        self.overflow = overflow or self.overflow
+        self.overflow_alert = alert or self.overflow_alert
+        try:
             # Move the binary point but keep the same bits
             self._m, self._n = m, self._m + self._n - m
             # Now round off unwanted bits
-            func = getattr(self, f'round_{rounding or self.rounding}')
-            func(n)
-            # If execution gets here, rounding did not cause an exception.
+            if rounding is None:
+                self._ROUND_DISPATCH[self._rounding._value_](self, n)
+            else:
+                getattr(self, f'round_{rounding}')(n)
+        except Exception:
+            self._bits, self._signed, self._m, self._n = qformat
+            raise
+        finally:
             # Revert the local overflow and overflow_alert properties back.
             self._overflow, self._overflow_alert = old
 
@@ -1572,19 +1629,17 @@ class FixedPoint:
         signed, m, n, bits = self._signed, self._m, self._n, self._bits
 
         # Validate arguments
-        if not int(n == 0 or signed) <= nint < m:
+        if not (nmin := int(n == 0 or signed)) <= nint < m:
             raise ValueError(f"{self:q} can only clamp between "
-                             f"[{int(n == 0 or signed)}, {m}) integer bits.")
+                             f"[{nmin}, {m}) integer bits.")
 
         # Truncate and see if the values still match
         nbits = nint + n
-        signedint = bits & (2**(nbits - signed) - 1)
-        signedint -= bits & (signed * 2**(nbits - 1))
+        signedint = bits & _bitmask(nbits - signed)
+        signedint -= bits & (signed << (nbits - 1))
 
         # Truncation is not sufficient, must clamp
         if signedint != (tmp := self._signedint):
-            bits = (1 << nbits) - (tmp >= 0)
-
             # Change local alert setting
             olvl = self._overflow_alert
             self._overflow_alert = Alert[alert or olvl.name]
@@ -1597,14 +1652,15 @@ class FixedPoint:
                 # Revert back to original alert level
                 self._overflow_alert = olvl
 
-            bits = getattr(self, f"_{extreme}") >> (self._m - nint)
+            bits = (self._minimum if tmp < 0 else self._maximum) >> \
+                (self._m - nint)
 
         # Truncation is sufficient!
         else:
             bits = signedint
 
         self._m = int(nint)
-        self._bits = bits & self.bitmask
+        self._bits = bits & _bitmask(self._m + self._n)
 
     def wrap(self: FixedPointType, nint: int, /, alert: str = None) -> None:
         """Remove integer bits by masking them away.
@@ -1618,14 +1674,14 @@ class FixedPoint:
         signed, m, n, bits = bool(self._signed), self._m, self._n, self._bits
 
         # Validate arguments
-        if not int(n == 0 or signed) <= nint < m:
+        if not (nmin := int(n == 0 or signed)) <= nint < m:
             raise ValueError(f"{self:q} can only wrap between "
-                             f"[{int(n == 0 or signed)}, {m}) integer bits.")
+                             f"[{nmin}, {m}) integer bits.")
 
         # Detect a change in value
         nbits = nint + n
-        signedint = bits & (2**(nbits - signed) - 1)
-        signedint -= bits & (signed * 2**(nbits - 1))
+        signedint = bits & _bitmask(nbits - signed)
+        signedint -= bits & (signed << (nbits - 1))
 
         # Warn on overflows
         if signedint != (tmp := self._signedint):
@@ -1643,7 +1699,7 @@ class FixedPoint:
                 self._overflow_alert = Alert[olvl]
 
         self._m = int(nint)
-        self._bits &= self.bitmask
+        self._bits &= _bitmask(self._m + self._n)
 
     def keep_lsbs(self: FixedPointType, m: int, n: int, /, overflow: str = None,
                   alert: str = None) -> None:
@@ -1668,8 +1724,8 @@ class FixedPoint:
                              f"{self._m + self._n}).")
 
         # Detect a change in value
-        signedint = (bits := self._bits) & (2**(length - signed) - 1)
-        signedint -= bits & (signed * 2**(length - 1))
+        signedint = (bits := self._bits) & _bitmask(length - signed)
+        signedint -= bits & (signed << (length - 1))
 
         # Change local alert setting
         olvl = self.overflow_alert
@@ -1693,12 +1749,30 @@ class FixedPoint:
         # Move the binary point but keep the same bits
         self._m, self._n = self._m + self._n - n, n
         # Now use the preferred method to remove unwanted bits
-        func = getattr(self, overflow or self.overflow)
         # The alert has already been issued if needed, handle overflow silently.
-        func(m, 'ignore')
+        if overflow is None:
+            self._OVERFLOW_DISPATCH[self._overflow._value_](self, m, 'ignore')
+        else:
+            getattr(self, overflow)(m, 'ignore')
         # Revert back to the original alert level
         self._overflow_alert = Alert[olvl]
 
+    # Rounding and overflow methods keyed by the value of their property
+    # setting, so dispatch doesn't have to build and look up the method name.
+    # Enum members hash in Python code, so their plain int values are used.
+    _ROUND_DISPATCH: ClassVar[Mapping[int, Callable[..., None]]] = {
+        Rounding['convergent'].value: convergent,
+        Rounding['nearest'].value: round_nearest,
+        Rounding['down'].value: round_down,
+        Rounding['in'].value: round_in,
+        Rounding['out'].value: round_out,
+        Rounding['up'].value: round_up,
+    }
+    _OVERFLOW_DISPATCH: ClassVar[Mapping[int, Callable[..., None]]] = {
+        Overflow['clamp'].value: clamp,
+        Overflow['wrap'].value: wrap,
+    }
+
     ###########################################################################
     # Alerts and error handling
     ###########################################################################
@@ -1710,41 +1784,48 @@ class FixedPoint:
     def _mwarn(self: FixedPointType, msg: str, *args: Any,
                **kwargs: int) -> None:
         """Mismatch warning method configured by mismatch_alert."""
-        keywords = {**self.__id, **kwargs}
-        if self._mismatch_alert == Alert['error']:
+        if self._mismatch_alert is _ERROR:
             from fixedpoint import MismatchError
+            keywords = {**self.__id, **kwargs} if kwargs else self.__id
             LOGGER.error(msg, *args, **keywords, stack_info=1)  # type: ignore
             raise MismatchError(self.__format_exception_msg(msg, args))
-        WARNER.log(self._mismatch_alert.value,
-                   msg, *args, **keywords)  # type: ignore
+        # Skip building the log record when the level is filtered out
+        if WARNER.isEnabledFor(level := self._mismatch_alert.value):
+            keywords = {**self.__id, **kwargs} if kwargs else self.__id
+            WARNER.log(level, msg, *args, **keywords)  # type: ignore
 
     def _owarn(self: FixedPointType, msg: str, *args: Any,
                **kwargs: int) -> None:
         """Overflow warning method configured by overflow_alert."""
-        keywords = {**self.__id, **kwargs}
-        if self._overflow_alert == Alert['error']:
+        if self._overflow_alert is _ERROR:
             from fixedpoint import FixedPointOverflowError
+            keywords = {**self.__id, **kwargs} if kwargs else self.__id
             LOGGER.error(msg, *args, **keywords, stack_info=1)  # type: ignore
             raise FixedPointOverflowError(self.__format_exception_msg(msg,
                                                                       args))
-        WARNER.log(self._overflow_alert.value,
-                   msg, *args, **keywords)  # type: ignore
+        # Skip building the log record when the level is filtered out
+        if WARNER.isEnabledFor(level := self._overflow_alert.value):
+            keywords = {**self.__id, **kwargs} if kwargs else self.__id
+            WARNER.log(level, msg, *args, **keywords)  # type: ignore
 
     def _iwarn(self: FixedPointType, msg: str, *args: Any,
                **kwargs: int) -> None:
         """Implicit cast warning method configured by implicit_cast_alert."""
-        keywords = {**self.__id, **kwargs}
-        if self._implicit_cast_alert == Alert['error']:
+        if self._implicit_cast_alert is _ERROR:
             from fixedpoint import ImplicitCastError
+            keywords = {**self.__id, **kwargs} if kwargs else self.__id
             LOGGER.error(msg, *args, **keywords, stack_info=1)  # type: ignore
             raise ImplicitCastError(self.__format_exception_msg(msg, args))
-        WARNER.log(self._implicit_cast_alert.value,
-                   msg, *args, **keywords)  # type: ignore
+        # Skip building the log record when the level is filtered out
+        if WARNER.isEnabledFor(level := self._implicit_cast_alert.value):
+            keywords = {**self.__id, **kwargs} if kwargs else self.__id
+            WARNER.log(level, msg, *args, **keywords)  # type: ignore
 
     def _log(self: FixedPointType, msg: str, *args: Any, **kwargs: int) -> None:
         """Log to file."""
-        keywords = {**self.__id, **kwargs}
-        LOGGER.debug(msg, *args, **keywords)  # type: ignore
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            keywords = {**self.__id, **kwargs} if kwargs else self.__id
+            LOGGER.debug(msg, *args, **keywords)  # type: ignore
 
     @staticmethod
     def enable_logging() -> None:
@@ -1762,56 +1843,49 @@ class FixedPoint:
 
         Returns -1 if val < 0, 1 if val > 0, 0 otherwise.
         """
-        signed: Union[int, float]
+        # The sign of a FixedPoint can be read straight from its bits
         if isinstance(fp, cls):
-            signed = fp._signedint
-        else:
-            signed = fp
-        return (signed > 0) - (signed < 0)
+            if not fp._bits:
+                return 0
+            if fp._signed and fp._bits >> (fp._m + fp._n - 1):
+                return -1
+            return 1
+        return (fp > 0) - (fp < 0)
 
     @classmethod
     def min_m(cls: Type[FixedPointType], val: Union[float, int], /,
               signed: bool = None) -> int:
         """Calculate the minimum integer bit width."""
-        # Start with an educated guess; round the value away from 0 and
-        # calculate bit width from there, since that would be worst-case
-        # rounding
-        wcround = cls.sign(val) * _ceil(abs(val))
-        ret = _ceil(_log2(abs(wcround))) if val else 1
+        # Round the value away from 0 and calculate bit width from there,
+        # since that would be worst-case rounding
+        wcround = _ceil(val) if val >= 0 else -_ceil(-val)
 
-        # A signed number ranges from [-2**(m-1), 2**(m-1)-1]
+        # A signed number ranges from [-2**(m-1), 2**(m-1)-1], so it needs a
+        # sign bit on top of the magnitude bits of its one's complement
         if signed or val < 0:
-            while not -(boundary := 2**(ret - 1)) <= wcround < boundary:
-                ret += 1
+            ret = (~wcround if wcround < 0 else wcround).bit_length() + 1
 
         # An unsigned number ranges from [0, 2**m-1]
         else:
-            ret += wcround >= 2**ret
+            ret = (wcround - 1).bit_length() if wcround else 1
+            ret += wcround >= 1 << ret
 
         return int(ret)
 
     @staticmethod
     def min_n(val: Union[int, float], /) -> int:
         """Calculate minimum fractional bit width."""
-        def recursive(val: Union[int, float], lo: int, hi: int) -> int:
-            # Recursive binary search; fast but overflow-prone
-            try:
-                if lo + 1 == hi:
-                    ret = hi if (val * 2**lo) % 1.0 else lo
-
-                elif (val * 2**(n := _ceil((lo + hi) / 2))) % 1.0:
-                    ret = recursive(val, n, hi)
-
-                else:
-                    ret = recursive(val, lo, n)
-
-            # Bubble search; slow but overflow-safe. Use as a last resort
-            except OverflowError:
-                ret = lo
-                while val % 1.0:  # pragma: no cover
-                    ret += 1
-                    val *= 2.0
-
-            return ret
-
-        return recursive(val, 0, _MAXEXPONENT)
+        # The exact ratio of a float has a power of 2 denominator
+        try:
+            _, denominator = val.as_integer_ratio()
+        # Infinity and NaN have no ratio
+        except (OverflowError, ValueError):
+            return _MAXEXPONENT
+        return denominator.bit_length() - 1
+
+
+# Setters of FixedPoint properties, used to validate context manager values
+_PROPERTY_SETTERS: Dict[str, Callable[[FixedPoint, Any], None]] = {
+    name: prop.fset for name, prop in vars(FixedPoint).items()
+    if isinstance(prop, property) and prop.fset
+}
@@ -1,4 +1,5 @@
 """Function versions of FixedPoint class methods."""
+from copy import copy
 from typing import TYPE_CHECKING
 
 # Avoid circular imports
@@ -33,10 +34,7 @@ def resize(fp: "FixedPoint", m: int, n: int, /, rounding: str = None,
     Override rounding, overflow, and overflow_alert settings for the scope of
     this function by specifying the appropriate arguments.
     """
-    from fixedpoint.fixedpoint import FixedPoint
-    ret: "FixedPoint" = FixedPoint._FixedPoint__new(  # type: ignore
-      fp.bits, fp.signed, fp.m, fp._n, fp.overflow, fp.rounding, fp.str_base,
-      fp.overflow_alert, fp.implicit_cast_alert, fp.mismatch_alert)
+    ret = copy(fp)
     ret.resize(m, n, rounding, overflow, alert)
     return ret
 
@@ -50,20 +48,14 @@ def trim(fp: "FixedPoint", /, ints: bool = None,
     Trim only integer bits or fractional bits by setting `fracs` or `ints`
     to True. By default, both integer and fractional bits are trimmed.
     """
-    from fixedpoint.fixedpoint import FixedPoint
-    ret: "FixedPoint" = FixedPoint._FixedPoint__new(  # type: ignore
-      fp.bits, fp.signed, fp.m, fp._n, fp.overflow, fp.rounding, fp.str_base,
-      fp.overflow_alert, fp.implicit_cast_alert, fp.mismatch_alert)
+    ret = copy(fp)
     ret.trim(ints, fracs)
     return ret
 
 
 def convergent(fp: "FixedPoint", nfrac: int, /) -> "FixedPoint":
     """Round half to even."""
-    from fixedpoint.fixedpoint import FixedPoint
-    ret: "FixedPoint" = FixedPoint._FixedPoint__new(  # type: ignore
-      fp.bits, fp.signed, fp.m, fp._n, fp.overflow, fp.rounding, fp.str_base,
-      fp.overflow_alert, fp.implicit_cast_alert, fp.mismatch_alert)
+    ret = copy(fp)
     ret.convergent(nfrac)
     return ret
 
@@ -73,48 +65,35 @@ round_convergent = convergent
 
 def round_nearest(fp: "FixedPoint", nfrac: int, /) -> "FixedPoint":
     """Round half up."""
-    from fixedpoint.fixedpoint import FixedPoint
-    ret = FixedPoint(fp)
+    ret = copy(fp)
     ret.round_nearest(nfrac)
     return ret
 
 
 def round_in(fp: "FixedPoint", nfrac: int, /) -> "FixedPoint":
     """Round towards 0."""
-    from fixedpoint.fixedpoint import FixedPoint
-    ret: "FixedPoint" = FixedPoint._FixedPoint__new(  # type: ignore
-      fp.bits, fp.signed, fp.m, fp._n, fp.overflow, fp.rounding, fp.str_base,
-      fp.overflow_alert, fp.implicit_cast_alert, fp.mismatch_alert)
+    ret = copy(fp)
     ret.round_in(nfrac)
     return ret
 
 
 def round_out(fp: "FixedPoint", nfrac: int, /) -> "FixedPoint":
     """Round half away from zero."""
-    from fixedpoint.fixedpoint import FixedPoint
-    ret: "FixedPoint" = FixedPoint._FixedPoint__new(  # type: ignore
-      fp.bits, fp.signed, fp.m, fp._n, fp.overflow, fp.rounding, fp.str_base,
-      fp.overflow_alert, fp.implicit_cast_alert, fp.mismatch_alert)
+    ret = copy(fp)
     ret.round_out(nfrac)
     return ret
 
 
 def round_up(fp: "FixedPoint", nfrac: int, /) -> "FixedPoint":
     """Round towards infinity."""
-    from fixedpoint.fixedpoint import FixedPoint
-    ret: "FixedPoint" = FixedPoint._FixedPoint__new(  # type: ignore
-      fp.bits, fp.signed, fp.m, fp._n, fp.overflow, fp.rounding, fp.str_base,
-      fp.overflow_alert, fp.implicit_cast_alert, fp.mismatch_alert)
+    ret = copy(fp)
     ret.round_up(nfrac)
     return ret
 
 
 def round_down(fp: "FixedPoint", nfrac: int, /) -> "FixedPoint":
     """Round towards negative infinity."""
-    from fixedpoint.fixedpoint import FixedPoint
-    ret: "FixedPoint" = FixedPoint._FixedPoint__new(  # type: ignore
-      fp.bits, fp.signed, fp.m, fp._n, fp.overflow, fp.rounding, fp.str_base,
-      fp.overflow_alert, fp.implicit_cast_alert, fp.mismatch_alert)
+    ret = copy(fp)
     ret.round_down(nfrac)
     return ret
 
@@ -126,10 +105,7 @@ def keep_msbs(fp: "FixedPoint", m: int, n: int, /, rounding: str = None,
     Override rounding, overflow, and overflow_alert settings for the scope of
     this function by specifying the appropriate arguments.
     """
-    from fixedpoint.fixedpoint import FixedPoint
-    ret: "FixedPoint" = FixedPoint._FixedPoint__new(  # type: ignore
-      fp.bits, fp.signed, fp.m, fp._n, fp.overflow, fp.rounding, fp.str_base,
-      fp.overflow_alert, fp.implicit_cast_alert, fp.mismatch_alert)
+    ret = copy(fp)
     ret.keep_msbs(m, n, rounding, overflow, alert)
     return ret
 
@@ -143,10 +119,7 @@ def clamp(fp: "FixedPoint", nint: int, /, alert: str = None) -> "FixedPoint":
     Override the overflow_alert setting for the scope of this method by
     specifying an alternative `alert`.
     """
-    from fixedpoint.fixedpoint import FixedPoint
-    ret: "FixedPoint" = FixedPoint._FixedPoint__new(  # type: ignore
-      fp.bits, fp.signed, fp.m, fp._n, fp.overflow, fp.rounding, fp.str_base,
-      fp.overflow_alert, fp.implicit_cast_alert, fp.mismatch_alert)
+    ret = copy(fp)
     ret.clamp(nint, alert)
     return ret
 
@@ -157,10 +130,7 @@ def wrap(fp: "FixedPoint", nint: int, /, alert: str = None) -> "FixedPoint":
     Override the overflow_alert setting for the scope of this method by
     specifying an alternative `alert`.
     """
-    from fixedpoint.fixedpoint import FixedPoint
-    ret: "FixedPoint" = FixedPoint._FixedPoint__new(  # type: ignore
-      fp.bits, fp.signed, fp.m, fp._n, fp.overflow, fp.rounding, fp.str_base,
-      fp.overflow_alert, fp.implicit_cast_alert, fp.mismatch_alert)
+    ret = copy(fp)
     ret.wrap(nint, alert)
     return ret
 
@@ -172,9 +142,6 @@ def keep_lsbs(fp: "FixedPoint", m: int, n: int, /, overflow: str = None,
     Override the overflow and overflow_alert setting for the scope of this
     function by specifying the appropriate arguments.
     """
-    from fixedpoint.fixedpoint import FixedPoint
-    ret: "FixedPoint" = FixedPoint._FixedPoint__new(  # type: ignore
-      fp.bits, fp.signed, fp.m, fp._n, fp.overflow, fp.rounding, fp.str_base,
-      fp.overflow_alert, fp.implicit_cast_alert, fp.mismatch_alert)
+    ret = copy(fp)
     ret.keep_lsbs(m, n, overflow, alert)
     return ret
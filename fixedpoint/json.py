@@ -19,10 +19,6 @@ class FixedPointEncoder(json.JSONEncoder):
         """Generate a JSON-serializable object for FixedPoint object o."""
         return [properties(o), [bool(o._signed), o._m, o._n], o._bits]
 
-    def encode(self, o: "FixedPoint") -> str:
-        """Return a JSON string representation of a FixedPoint object o."""
-        return super().encode(self.default(o))
-
 
 class FixedPointDecoder(json.JSONDecoder):
     """Decodes a JSON object into a FixedPoint object."""
@@ -36,10 +32,9 @@ class FixedPointDecoder(json.JSONDecoder):
 
     def decode(self, s: str, *args: Any, **kwargs: Any) -> "FixedPoint":
         """Decode a JSON document string s into a FixedPoint object."""
-        largs = self.decode_attributes(s, *args)
+        props, qformat, bits = self.decode_attributes(s, *args)
         from fixedpoint import FixedPoint
-        return FixedPoint(hex(largs.pop()), *largs.pop(),
-                          **largs.pop())
+        return FixedPoint(hex(bits), *qformat, **props)
 
 
 DEFAULT_ENCODER = FixedPointEncoder(separators=(',', ':'))
@@ -1,6 +1,6 @@
 """FixedPoint logging facilities."""
+import os
 import sys
-import pathlib
 import logging
 
 __all__ = ('LOGGER', 'DEFAULT_FILE_HANDLER', 'DEFAULT_FILE_HANDLER_FORMATTER',
@@ -12,7 +12,7 @@ LOGGER.setLevel(logging.CRITICAL)
 
 # This is the default file handler to be used unless a different handler is
 # specified when logging is enabled.
-logfile = pathlib.Path(__file__).parent / 'fixedpoint.log'
+logfile = os.path.join(os.path.dirname(__file__), 'fixedpoint.log')
 DEFAULT_FILE_HANDLER = logging.FileHandler(logfile, 'w', None, True)
 DEFAULT_FILE_HANDLER.setLevel(logging.DEBUG)
 
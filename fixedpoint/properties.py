@@ -1,7 +1,11 @@
 """FixedPoint property validation and handling."""
 from enum import Enum
 from logging import ERROR, WARNING, DEBUG
-from typing import (Callable, ClassVar, Mapping, Tuple, Union, TYPE_CHECKING)
+from operator import attrgetter
+from typing import (Callable, ClassVar, Dict, Mapping, Tuple, Union,
+                    TYPE_CHECKING)
+
+from fixedpoint.logging import WARNER
 
 __all__ = ('PROPERTIES', 'StrConv', 'StrBase', 'Alert', 'Overflow', 'Rounding',
            'PropertyResolver')
@@ -13,6 +17,9 @@ if TYPE_CHECKING:  # pragma: no cover
 PROPERTIES = ('str_base', 'mismatch_alert', 'overflow_alert',
               'implicit_cast_alert', 'overflow', 'rounding')
 
+# Retrieves the enumerated value of each property of a FixedPoint object
+_property_members = attrgetter(*(f'_{p}' for p in PROPERTIES))
+
 StrConv: Mapping[int, Callable[[int], str]] = {2: bin, 8: oct, 10: str, 16: hex}
 StrBase = Enum('str_base',  # type: ignore # (too many arguments)
                {'0b': 2, '0o': 8, ' ': 10, '0x': 16},
@@ -31,8 +38,25 @@ Rounding = Enum('rounding',  # type: ignore # (too many arguments)
                 {'convergent': 200, 'nearest': 201, 'down': 202, 'in': 203,
                  'out': 204, 'up': 205}, module=__name__, qualname="Rounding")
 
+# Enum members prioritized when resolving mismatches
+_ERROR = Alert['error']
+_WARNING = Alert['warning']
+_CLAMP = Overflow['clamp']
+_NEAREST = Rounding['nearest']
+_ROUNDING_ORDER = tuple(Rounding)
+
 Property = Union[StrBase, Alert, Overflow, Rounding]
 ResolvedProps = Mapping[str, Union[str, int]]
+WarnerFunc = Callable[..., None]
+
+# Properties of operands whose property members all match, keyed by those
+# members. There are only a few hundred combinations, so this stays small.
+_MATCHED: Dict[Tuple[Property, ...], ResolvedProps] = {}
+
+
+def _alerted(alert: Alert) -> bool:
+    """Determine if a warner with the given alert raises or logs anything."""
+    return alert is _ERROR or WARNER.isEnabledFor(alert._value_)
 
 
 class PropertyResolver:
@@ -56,8 +80,9 @@ class PropertyResolver:
 
         If they don't match, then 16 is used. No warning is issued.
         """
-        if len(checkset := {obj._str_base.value for obj in args}) == 1:
-            ret = checkset.pop()
+        members = [obj._str_base for obj in args]
+        if members.count(base := members[0]) == len(members):
+            ret = base._value_
         else:
             ret = 16
 
@@ -73,16 +98,18 @@ class PropertyResolver:
             3. ignore
         A MismatchWarning is issued if they don't match.
         """
-        if len(checkset := {obj._implicit_cast_alert for obj in args}) == 1:
-            ret = checkset.pop()
-        # If there's a mismatch, handle it based on mismatch_alert property.
-        else:
-            ret = (Alert['warning'] if Alert['warning'] in checkset
-                   else Alert['error'])
-            _, warner = self._mismatch_alert(*args, stacklevel=stacklevel + 1)
-            warner("Non-matching implicit_cast_alert behaviors %s.",
-                   [alert.name for alert in checkset], stacklevel=stacklevel)
-            warner("Using %r.", ret.name, stacklevel=stacklevel)
+        members = [obj._implicit_cast_alert for obj in args]
+        if members.count(ret := members[0]) != len(members):
+            # If there's a mismatch, handle it based on mismatch_alert property.
+            checkset = set(members)
+            ret = _WARNING if _WARNING in checkset else _ERROR
+            severity, warner = self._mismatch_alert(*args,
+                                                    stacklevel=stacklevel + 1)
+            if _alerted(severity):
+                warner("Non-matching implicit_cast_alert behaviors %s.",
+                       [alert.name for alert in checkset],
+                       stacklevel=stacklevel)
+                warner("Using %r.", ret.name, stacklevel=stacklevel)
 
         return ret.name
 
@@ -97,23 +124,25 @@ class PropertyResolver:
             3. ignore
         A MismatchWarning is issued if they don't match.
         """
-        if len(checkset := {obj._overflow_alert for obj in args}) == 1:
-            ret = checkset.pop()
-        # If there's a mismatch, handle it based on mismatch_alert property.
-        else:
-            ret = (Alert['error'] if Alert['error'] in checkset else
-                   Alert['warning'])
-            _, warner = self._mismatch_alert(*args, stacklevel=stacklevel + 1)
-            warner("Non-matching overflow_alert behaviors %s.",
-                   [alert.name for alert in checkset], stacklevel=stacklevel)
-            warner("Using %r.", ret.name, stacklevel=stacklevel)
+        members = [obj._overflow_alert for obj in args]
+        if members.count(ret := members[0]) != len(members):
+            # If there's a mismatch, handle it based on mismatch_alert property.
+            checkset = set(members)
+            ret = _ERROR if _ERROR in checkset else _WARNING
+            severity, warner = self._mismatch_alert(*args,
+                                                    stacklevel=stacklevel + 1)
+            if _alerted(severity):
+                warner("Non-matching overflow_alert behaviors %s.",
+                       [alert.name for alert in checkset],
+                       stacklevel=stacklevel)
+                warner("Using %r.", ret.name, stacklevel=stacklevel)
 
         return ret.name
 
     _oalert = overflow_alert
 
     def _mismatch_alert(self, *args: "FixedPoint",
-                        stacklevel: int = 5) -> Tuple[str, Callable[..., None]]:
+                        stacklevel: int = 5) -> Tuple[Alert, WarnerFunc]:
         """Resolve mismatch_alert properties between 2 FixedPoint objects.
 
         If they don't match, the most severe alarm between them is triggered. As
@@ -121,40 +150,27 @@ class PropertyResolver:
             1. warning
             2. ignore
         """
-        if len(set(checklist := [obj._mismatch_alert for obj in args])) == 1:
-            alert = args[0]._mismatch_alert
+        checklist = [obj._mismatch_alert for obj in args]
+        if checklist.count(alert := checklist[0]) == len(checklist):
             warnerfunc = args[0]._mwarn
         else:
-            # First make sure the mismatches don't trigger a warning
-            warner = args[0]._mwarn
-            for name in ('error', 'warning'):  # pragma: no branch
-                for i, alert in enumerate(checklist):
-                    if alert == Alert[name]:
-                        warner = args[i]._mwarn
-                        break
-                else:
-                    continue
-                break
+            # The most severe alert present triggers the mismatch warning
+            severity = _ERROR if _ERROR in checklist else _WARNING
+            warner = args[checklist.index(severity)]._mwarn
 
             # Prioritize for return value
-            for name in ('warning', 'error'):  # pragma: no branch
-                for i, alert in enumerate(checklist):
-                    if alert == Alert[name]:
-                        warnerfunc = args[i]._mwarn
-                        break
-                else:
-                    continue
-                break
+            alert = _WARNING if _WARNING in checklist else _ERROR
+            warnerfunc = args[checklist.index(alert)]._mwarn
 
             # Since every resolver method must check for mismatch, only trigger
             # a warning on the first detected mismatch_alert mismatch,
             # subsequent mismatch_alert warnings are ignored.
-            if not self.__ignore_mismatch:
+            if not self.__ignore_mismatch and _alerted(severity):
                 warner('Non-matching mismatch_alert behaviors %s.',
                        [x.name for x in checklist], stacklevel=stacklevel)
                 warner('Using %r.', alert.name)
 
-        return alert.name, warnerfunc
+        return alert, warnerfunc
 
     def mismatch_alert(self, *args: "FixedPoint", stacklevel: int = 4) -> str:
         """Resolve mismatch_alert properties between 2 FixedPoint objects.
@@ -164,7 +180,7 @@ class PropertyResolver:
             1. warning
             2. ignore
         """
-        return self._mismatch_alert(*args, stacklevel=stacklevel + 1)[0]
+        return self._mismatch_alert(*args, stacklevel=stacklevel + 1)[0].name
 
     _malert = mismatch_alert
 
@@ -180,23 +196,26 @@ class PropertyResolver:
             6. up
         A MismatchWarning is issued if they don't match.
         """
-        if len(checkset := {obj._rounding for obj in args}) == 1:
-            ret = checkset.pop()
-        else:
+        members = [obj._rounding for obj in args]
+        if members.count(ret := members[0]) != len(members):
+            checkset = set(members)
             # If all values are unsigned, resolved rounding method is 'nearest'
             # if any argument has this attribute set.
             if any([x._signed for x in args]) or \
-                    (ret := Rounding['nearest']) not in checkset:
-                for rounding in Rounding:  # pragma: no branch
+                    (ret := _NEAREST) not in checkset:
+                for rounding in _ROUNDING_ORDER:  # pragma: no branch
                     if rounding in checkset:
                         ret = rounding
                         break
 
             # There's a mismatch, decide how to handle it base on mismatch_alert
-            _, warner = self._mismatch_alert(*args, stacklevel=stacklevel + 1)
-            warner("Non-matching rounding behaviors %s.",
-                   [val.name for val in checkset], stacklevel=stacklevel)
-            warner("Using %r.", ret.name, stacklevel=stacklevel)
+            severity, warner = self._mismatch_alert(*args,
+                                                    stacklevel=stacklevel + 1)
+            if _alerted(severity):
+                warner("Non-matching rounding behaviors %s.",
+                       [val.name for val in checkset],
+                       stacklevel=stacklevel)
+                warner("Using %r.", ret.name, stacklevel=stacklevel)
 
         return ret.name
 
@@ -208,24 +227,37 @@ class PropertyResolver:
             2. wrap
         A MismatchWarning is issued if they don't match.
         """
-        if len(checkset := {obj._overflow for obj in args}) == 1:
-            ret = checkset.pop()
-        else:
-            ret = Overflow['clamp']
+        members = [obj._overflow for obj in args]
+        if members.count(ret := members[0]) != len(members):
+            checkset = set(members)
+            ret = _CLAMP
 
             # There's a mismatch, decide how to handle it base on mismatch_alert
-            _, warner = self._mismatch_alert(*args, stacklevel=stacklevel + 1)
-            warner("Non-matching overflow behaviors %s.",
-                   [val.name for val in checkset], stacklevel=stacklevel)
-            warner("Using %r.", ret.name, stacklevel=stacklevel)
+            severity, warner = self._mismatch_alert(*args,
+                                                    stacklevel=stacklevel + 1)
+            if _alerted(severity):
+                warner("Non-matching overflow behaviors %s.",
+                       [val.name for val in checkset],
+                       stacklevel=stacklevel)
+                warner("Using %r.", ret.name, stacklevel=stacklevel)
 
         return ret.name
 
     def all(self, *args: "FixedPoint", stacklevel: int = 4) -> ResolvedProps:
         """Resolve all properties."""
         ret: ResolvedProps
-        if len(args) == 1:
-            ret = {p: getattr(args[0], p) for p in PROPERTIES}
+        # When all properties already match (e.g., operands that were created
+        # alike) there's nothing to resolve and no mismatch to report.
+        members = _property_members(args[0])
+        if len(args) == 1 or all(_property_members(obj) == members
+                                 for obj in args[1:]):
+            try:
+                props = _MATCHED[members]
+            except KeyError:
+                props = _MATCHED[members] = {p: getattr(args[0], p)
+                                             for p in PROPERTIES}
+            # Callers get their own copy, so they can't alter the cache
+            ret = dict(props)
         else:
             kwargs = dict(stacklevel=stacklevel + 1)
             ret = dict(mismatch_alert=self._malert(*args, **kwargs))
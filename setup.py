@@ -26,30 +26,43 @@ import re
 
 ROOT = pathlib.Path(__file__).parent
 
+# Matches rst link targets and roles in long_description.rst
+LINK_REGEX = re.compile(r' <[^>]+>')
+ROLE_REGEX = re.compile(r':[^:]+:`([^`]+)`')
+
+# https://www.python.org/dev/peps/pep-0440/#version-scheme
+# https://regex101.com/r/Ly7O1x/319
+# See readme.md for the Versioning Public API
+VERSION_REGEX = re.compile(
+    r"""__version__\s*=\s*['"]{1,3}"""
+    r"(?P<release>(?:0|[1-9])\d*(?:\.(?:0|[1-9]\d*)){2})"
+    r"(?:-(?P<pre>(?P<prel>a|b|rc)(?P<pren>(?:0|[1-9])\d*)))?"
+    r"(?:\+(?P<local>[a-z\d]+(?:[-_\.][a-z\d]+)*))?"
+    r"""['"]{1,3}""")
+
+
+def strip_role(m: re.Match) -> str:
+    """Remove all decoration from rst role object.
+
+    E.g.: :attr:`~fixedpoint.FixedPoint.bits` converts to bits
+    """
+    M = m.group(1)
+    return M.split('.')[-1] if M.startswith('~') else M
+
 
 def long_description() -> str:
     """Compile the long description."""
     # Removes links from long_description.rst
-    with open(ROOT / 'docs' / 'source' / 'long_description.rst') as f:
-        rst = f.read()
-
-    def repl(m: re.Match) -> str:
-        """Remove all decoration from rst role object.
-
-        E.g.: :attr:`~fixedpoint.FixedPoint.bits` converts to bits
-        """
-        M = m.group(1)
-        return M.split('.')[-1] if M.startswith('~') else M
+    rst = (ROOT / 'docs' / 'source' / 'long_description.rst').read_text(
+        encoding='utf-8')
 
-    nolinks = re.sub(r' <[^>]+>', '', rst)
-    noroles = re.sub(r':[^:]+:`([^`]+)`', repl, nolinks)
+    nolinks = LINK_REGEX.sub('', rst)
+    noroles = ROLE_REGEX.sub(strip_role, nolinks)
 
     # Append the license file
-    license = '\nThe fixedpoint package is released under the BSD license.'
-    with open(ROOT / 'LICENSE') as f:
-        license += f'\n\n{f.read()}'
-
-    return noroles + license
+    license = (ROOT / 'LICENSE').read_text(encoding='utf-8')
+    return (f'{noroles}\nThe fixedpoint package is released under the BSD '
+            f'license.\n\n{license}')
 
 
 def get_version() -> str:
@@ -60,17 +73,13 @@ def get_version() -> str:
     (e.g., pip install fixedpoint), it will hold the master copy.
     """
     src = ROOT / 'fixedpoint' / '__init__.py'
-    # https://www.python.org/dev/peps/pep-0440/#version-scheme
-    # https://regex101.com/r/Ly7O1x/319
-    # See readme.md for the Versioning Public API
-    regex = (r"""__version__\s*=\s*['"]{1,3}"""
-             r"(?P<release>(?:0|[1-9])\d*(?:\.(?:0|[1-9]\d*)){2})"
-             r"(?:-(?P<pre>(?P<prel>a|b|rc)(?P<pren>(?:0|[1-9])\d*)))?"
-             r"(?:\+(?P<local>[a-z\d]+(?:[-_\.][a-z\d]+)*))?"
-             r"""['"]{1,3}""")
-
+    vsrc = None
     with open(src) as f:
-        vsrc = re.search(regex, f.read())
+        # __version__ is assigned on its own line near the top of the file
+        for line in f:
+            if line.startswith('__version__'):
+                vsrc = VERSION_REGEX.match(line)
+                break
 
     if not vsrc:
         raise ValueError(f"Invalid __version__ in '{f.name}'.")
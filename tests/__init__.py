@@ -14,18 +14,15 @@ TESTMATCH = re.compile(
     os.environ.get('NOSE_TESTMATCH', r'(?:^|[\b_\.%s-])[Tt]est' % os.sep))
 
 # Add ROOT to sys.path if it doesn't exist
-for path in sys.path:
-    if ROOT.resolve() == pathlib.Path(path):
-        break
-else:
-    sys.path.insert(1, str(ROOT.resolve()))
-    print(f'inserted {ROOT.resolve()} in sys.path')
+root = ROOT.resolve()
+if root not in {pathlib.Path(path) for path in sys.path}:
+    sys.path.insert(1, str(root))
+    print(f'inserted {root} in sys.path')
 
 # Grab all the tests from subpackages and put them in this module. When
 # tests from different modules have matching names (like test_str_base), an
 # exception is raise and the conflicting tests are called out.
 testmap = {}
-failures = {}
 fail = False
 for subpackage in find_packages(str(pathlib.Path(__file__).parent.resolve())):
     module = importlib.import_module(f'tests.{subpackage}')
@@ -36,19 +33,16 @@ for subpackage in find_packages(str(pathlib.Path(__file__).parent.resolve())):
         symbols = [x for x in module.__dict__ if not x.startswith('_')]
 
     for symbol in symbols:
-        func = getattr(module, symbol)
-        if TESTMATCH.search(symbol) and callable(func):
-            if symbol in testmap:
-                fail = True
-                if symbol in failures:
-                    failures[symbol].append(subpackage)
-                else:
-                    failures[symbol] = [subpackage]
-                if not isinstance(testmap[symbol], list):
-                    testmap[symbol] = [testmap[symbol]]
-                testmap[symbol].append(subpackage)
-            else:
+        # Most symbols aren't tests, so check the name before the object
+        if TESTMATCH.search(symbol) and callable(func := getattr(module,
+                                                                 symbol)):
+            if (modules := testmap.get(symbol)) is None:
                 testmap[symbol] = subpackage
+            else:
+                fail = True
+                if not isinstance(modules, list):
+                    testmap[symbol] = modules = [modules]
+                modules.append(subpackage)
 
             # Import the symbol to this module.
             setattr(sys.modules[__name__], symbol, func)
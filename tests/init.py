@@ -27,8 +27,8 @@ UTLOG.info("RANDOM SEED: %d", seed, **LOGID)
 
 def setup_logging():
     logger = logging.getLogger("FP")
-    # Remove all handlers
-    for handler in logger.handlers:
+    # Remove all handlers (from a copy, since removing mutates the list)
+    for handler in logger.handlers[:]:
         logger.removeHandler(handler)
     # Generate custom rotating file handler with formatter
     handler = tools.TestCaseRotatingFileHandler()
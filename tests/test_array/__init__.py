@@ -0,0 +1,159 @@
+#!/usr/bin/env python3.8
+# Copyright 2020, Schweitzer Engineering Laboratories, Inc
+# SEL Confidential
+import random
+import operator
+
+import numpy
+
+from ..init import (
+    uut,
+    UTLOG,
+    LOGID,
+    nose,
+)
+from .. import tools
+
+NUM_ELEMENTS = 8
+
+def random_elements(s, m, n):
+    """Generate FixedPoint objects that share a Q format.
+    """
+    return [uut.FixedPoint(hex(random.getrandbits(m + n)), s, m, n,
+                           overflow_alert='ignore', mismatch_alert='ignore')
+            for _ in range(NUM_ELEMENTS)]
+
+def random_format():
+    """Generate a random Q format, sometimes wider than 64 bits.
+    """
+    s = random.randrange(2)
+    return s, random.randint(s, 48), random.randint(1, 48)
+
+def elementwise(func):
+    """Bits and Q format of each element, or the exception type raised.
+    """
+    try:
+        return [(x.bits, x.qformat) for x in func()]
+    except Exception as exc:
+        return type(exc)
+
+@tools.setup(progress_bar=True)
+def test_array_initialization():
+    """Verify FixedPointArray initialization
+    """
+    for _ in tools.test_iterator():
+        s, m, n = random_format()
+        fps = random_elements(s, m, n)
+
+        x = uut.FixedPointArray(fps)
+        nose.tools.assert_equal(len(x), NUM_ELEMENTS)
+        nose.tools.assert_equal(x.qformat, fps[0].qformat)
+        nose.tools.assert_equal(list(x.bits), [fp.bits for fp in fps])
+        nose.tools.assert_equal([repr(fp) for fp in x], [repr(fp) for fp in fps])
+        nose.tools.assert_equal(list(x.to_float()), [float(fp) for fp in fps])
+
+        y = uut.FixedPointArray.from_bits([fp.bits for fp in fps], s, m, n)
+        nose.tools.assert_equal(list(y.bits), list(x.bits))
+
+        # Values are widened to a common Q format
+        floats = [float(fp) for fp in fps] + [-1.5]
+        z = uut.FixedPointArray(floats)
+        nose.tools.assert_equal(list(z.to_float()), floats)
+
+    with nose.tools.assert_raises_regex(ValueError, 'must share a Q format'):
+        uut.FixedPointArray([uut.FixedPoint(1), uut.FixedPoint(-1)])
+
+    with nose.tools.assert_raises_regex(ValueError, 'empty'):
+        uut.FixedPointArray([])
+
+@tools.setup(progress_bar=True)
+def test_array_arithmetic():
+    """Verify FixedPointArray +, -, *
+    """
+    operations = [
+        operator.add,
+        operator.sub,
+        operator.mul,
+    ]
+    for _ in tools.test_iterator():
+        afmt, bfmt = random_format(), random_format()
+        aa, bb = random_elements(*afmt), random_elements(*bfmt)
+        a, b = uut.FixedPointArray(aa), uut.FixedPointArray(bb)
+        UTLOG.debug("%s and %s", a.qformat, b.qformat, **LOGID)
+
+        for op in operations:
+            # Arrays must match FixedPoint results element for element
+            nose.tools.assert_equal(
+                elementwise(lambda: op(a, b)),
+                elementwise(lambda: [op(x, y) for x, y in zip(aa, bb)]))
+
+            # FixedPoint operands are broadcast
+            nose.tools.assert_equal(
+                elementwise(lambda: op(a, bb[0])),
+                elementwise(lambda: [op(x, bb[0]) for x in aa]))
+            nose.tools.assert_equal(
+                elementwise(lambda: op(bb[0], a)),
+                elementwise(lambda: [op(bb[0], x) for x in aa]))
+
+            # numpy scalars are broadcast too, and arrays are rejected
+            nose.tools.assert_equal(
+                elementwise(lambda: op(numpy.int64(3), a)),
+                elementwise(lambda: [op(3, x) for x in aa]))
+            with nose.tools.assert_raises(TypeError):
+                op(numpy.zeros(NUM_ELEMENTS), a)
+
+        # Operands should not change
+        nose.tools.assert_equal(list(a.bits), [x.bits for x in aa])
+        nose.tools.assert_equal(list(b.bits), [x.bits for x in bb])
+
+@tools.setup(progress_bar=True)
+def test_array_rounding():
+    """Verify FixedPointArray round()
+    """
+    for _ in tools.test_iterator():
+        s, m, n = random_format()
+        aa = random_elements(s, m, n)
+        rounding = random.choice(['convergent', 'nearest', 'down', 'in',
+                                  'out', 'up'])
+        for x in aa:
+            x.rounding = rounding
+        a = uut.FixedPointArray(aa)
+        nfrac = random.randrange(n)
+        UTLOG.debug("%s to %d (%s)", a.qformat, nfrac, rounding, **LOGID)
+
+        # Arrays must match FixedPoint results element for element
+        nose.tools.assert_equal(
+            elementwise(lambda: round(a, nfrac)),
+            elementwise(lambda: [round(x, nfrac) for x in aa]))
+
+    # Overflow is handled for every element, but only alerted once
+    x = uut.FixedPointArray([3.5, 1.5], 0, 2, 1, rounding='up',
+                            overflow_alert='warning')
+    with tools.CaptureWarnings() as warn:
+        y = round(x, 0)
+    nose.tools.assert_equal(list(y.bits), [3, 2])
+    nose.tools.assert_equal(len(warn.logs), 2)
+    nose.tools.assert_regex(warn.logs[0], 'Rounding up to UQ2.0 causes')
+    nose.tools.assert_regex(warn.logs[1], 'Clamped to maximum')
+
+@tools.setup(progress_bar=False)
+def test_array_unsigned_subtraction():
+    """Verify FixedPointArray unsigned subtraction overflow
+    """
+    x = uut.FixedPointArray([1, 3], 0, 2, 0, overflow_alert='warning')
+    y = uut.FixedPointArray([2, 2], 0, 2, 0, overflow_alert='warning')
+
+    with tools.CaptureWarnings() as warn:
+        z = x - y
+    nose.tools.assert_equal(list(z.bits), [0, 1])
+    nose.tools.assert_regex(warn.logs[0], 'Unsigned subtraction causes overflow')
+    nose.tools.assert_regex(warn.logs[1], 'Clamped to minimum')
+
+    x = uut.FixedPointArray([1, 3], 0, 2, 0)
+    with nose.tools.assert_raises(uut.FixedPointOverflowError):
+        x - y
+
+    # Wide words use Python ints
+    x = uut.FixedPointArray([2**70, 1], 0, 71, 0)
+    nose.tools.assert_equal((x * x).bits.dtype, numpy.dtype(object))
+    nose.tools.assert_equal(list((x * x).bits), [2**140, 1])
@@ -1010,3 +1010,8 @@ def test_min_n():
         if x.n:
             nose.tools.assert_equal(x.bits['lsb'], 1, repr(x))
 
+    # Floats too big to scale by 2**n still have no fractional bits
+    nose.tools.assert_equal(uut.FixedPoint.min_n(2.0**1000), 0)
+    nose.tools.assert_equal(uut.FixedPoint.min_n(-1e300), 0)
+    nose.tools.assert_equal(uut.FixedPoint.min_n(5e-324), 1074)
+
@@ -11,6 +11,7 @@ import io
 import pathlib
 import sys
 import pickle
+import copy
 
 from ..init import (
     uut,
@@ -149,6 +150,32 @@ def test_logging():
 
     handler.setStream(oldstream)
 
+@tools.setup(progress_bar=True)
+def test_copy():
+    """Verify copy.copy
+    """
+    for init, args, kwargs, _, _, _, _ in nondefault_props_gen():
+        x = uut.FixedPoint(init, *args, **kwargs)
+        y = copy.copy(x)
+        nose.tools.assert_is_not(x, y)
+        tools.verify_attributes(y,
+            signed=x.signed,
+            m=x.m,
+            n=x.n,
+            bits=x.bits,
+            str_base=x.str_base,
+            rounding=x.rounding,
+            overflow=x.overflow,
+            overflow_alert=x.overflow_alert,
+            mismatch_alert=x.mismatch_alert,
+            implicit_cast_alert=x.implicit_cast_alert,
+        )
+
+        # The copy has its own context manager
+        with y(m=y.m + 1):
+            nose.tools.assert_equal(x.m, y.m - 1)
+        nose.tools.assert_equal(x.m, y.m)
+
 @nose.tools.nottest
 @tools.setup(progress_bar=True)
 def serialization(scheme, serialize, skwargs, deserialize, dkwargs):
@@ -661,6 +661,12 @@ def test_all():
         if (rS := result['str_base']) != 16:
             nose.tools.assert_not_in(16, S)
 
+        # Changing a result doesn't change later results
+        changed = UUT.all(x, x)
+        changed['overflow'] = 'wrap' if x.overflow == 'clamp' else 'clamp'
+        nose.tools.assert_equal(UUT.all(x)['overflow'], x.overflow)
+        nose.tools.assert_equal(UUT.all(x, x)['overflow'], x.overflow)
+
 
 
 